@@ -1,5 +1,7 @@
 from database import SessionLocal, Base, engine
 from models import Cause
+from sources import DEFAULT_SOURCE
+import search_cache
 from datetime import date, time, timedelta
 
 Base.metadata.create_all(bind=engine)
@@ -145,6 +147,8 @@ try:
         ]
         
         db.bulk_save_objects(sample_causes)
+        # Tells a running server's caches and fuzzy index about the new lists
+        search_cache.bump_generation(db, {(c.source or DEFAULT_SOURCE, c.hearing_date) for c in sample_causes})
         db.commit()
         print(f"Successfully added {len(sample_causes)} sample causes to the database.")
         print("Sample data includes:")
@@ -0,0 +1,162 @@
+import argparse
+import logging
+import re
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from models import Advocate, Cause, CauseAdvocate
+
+logger = logging.getLogger(__name__)
+
+# Advocate index behind GET /api/advocates/hearings.
+#
+# The lists name advocates however the registry typed them that day:
+# "M/S. S.SEKAR", "M/S.S.SEKAR (1234/2005)", "Mr. S. Sekar". Each
+# Cause.advocate is split into names (on commas), stripped of honorifics,
+# enrollment numbers and dates, and keyed by its letters and digits alone,
+# so every spelling above is the advocate "SSEKAR". Causes are linked to
+# advocates in cause_advocates, which also holds each advocate's list for
+# a hearing date in court order, rebuilt whenever that date is ingested.
+#
+# Links for lists ingested before this existed: run this file to rebuild.
+
+# Leading honorifics, any number of them ("M/S. MR. ...")
+honorific_pattern = re.compile(r"^(?:M/S|MESSRS|MR|MRS|MS|DR|SRI|SMT|THIRU|TMT|SELVI)\b\.?\s*", re.IGNORECASE)
+# Enrollment numbers and dates the registry appends: "(956/1990)", "DT 17/11/2023"
+noise_pattern = re.compile(r"\([^)]*\)|\bDT\.?\s*\d{1,2}/\d{1,2}/\d{2,4}", re.IGNORECASE)
+# Words cut off at the line end: "RAM GOKUL ADVOCATES AND", "M.ROHINI DT"
+dangling_pattern = re.compile(r"(?:\s+(?:AND|&|DT\.?))+\s*$", re.IGNORECASE)
+
+BATCH_SIZE = 500
+
+
+def clean_name(name: str) -> str:
+    name = noise_pattern.sub(" ", name)
+    while True:
+        stripped = honorific_pattern.sub("", name.strip())
+        if stripped == name.strip():
+            break
+        name = stripped
+    name = re.sub(r"\s*\.\s*", ". ", name)
+    name = dangling_pattern.sub("", re.sub(r"\s+", " ", name)).strip(" .-")
+    return name.upper()
+
+
+def advocate_key(name: str) -> str:
+    """Key of one advocate name: upper case letters and digits, honorifics and noise removed."""
+    return re.sub(r"[^A-Z0-9]", "", clean_name(name))
+
+
+def split_advocates(value: str | None) -> list:
+    # [(name_key, display name)] for a Cause.advocate value, in listed
+    # order, without repeats. A part with no word of three letters is
+    # initials cut off at the line end ("N.S."), not a name.
+    names = {}
+    for part in re.split(r"[,;]", value or ""):
+        name = clean_name(part)
+        key = re.sub(r"[^A-Z0-9]", "", name)
+        if re.search(r"[A-Z]{3}", name) and key not in names:
+            names[key] = name
+    return list(names.items())
+
+
+def advocate_ids(db: Session, names: dict) -> dict:
+    # name_key -> advocate id for names ({name_key: display name}),
+    # creating the advocates not seen before
+    ids = {}
+    keys = list(names)
+    for i in range(0, len(keys), BATCH_SIZE):
+        ids.update(db.query(Advocate.name_key, Advocate.id).filter(Advocate.name_key.in_(keys[i:i + BATCH_SIZE])))
+    missing = [key for key in keys if key not in ids]
+    if missing:
+        db.execute(insert(Advocate.__table__), [{"name_key": key, "name": names[key]} for key in missing])
+        for i in range(0, len(missing), BATCH_SIZE):
+            ids.update(db.query(Advocate.name_key, Advocate.id).filter(Advocate.name_key.in_(missing[i:i + BATCH_SIZE])))
+    return ids
+
+
+def list_order(row) -> tuple:
+    # Court, then serial number as a number where it is one
+    sr_no = (row.sr_no or "").strip()
+    return (
+        row.court_number is None,
+        row.court_number or 0,
+        row.court_suffix or "",
+        (0, int(sr_no), "") if sr_no.isdigit() else (1, 0, sr_no),
+        row.id,
+    )
+
+
+def remove_causes(db: Session, cause_ids):
+    cause_ids = list(cause_ids)
+    for i in range(0, len(cause_ids), BATCH_SIZE):
+        db.query(CauseAdvocate).filter(CauseAdvocate.cause_id.in_(cause_ids[i:i + BATCH_SIZE])).delete(
+            synchronize_session=False
+        )
+
+
+def update_segment(db: Session, source: str, hearing_date) -> int:
+    """Rebuild the advocate links and daily lists of one ingested list; returns the links written.
+
+    The caller commits.
+    """
+    db.query(CauseAdvocate).filter(
+        CauseAdvocate.hearing_date == hearing_date, CauseAdvocate.source == source
+    ).delete(synchronize_session=False)
+    rows = (
+        db.query(Cause.id, Cause.advocate, Cause.court_number, Cause.court_suffix, Cause.sr_no)
+        .filter(Cause.source == source, Cause.hearing_date == hearing_date, Cause.advocate.isnot(None))
+        .all()
+    )
+    rows.sort(key=list_order)
+
+    names_by_cause = [(row.id, split_advocates(row.advocate)) for row in rows]
+    ids = advocate_ids(db, {key: name for _, names in names_by_cause for key, name in names})
+    links = []
+    positions = {}
+    for cause_id, names in names_by_cause:
+        for key, _ in names:
+            advocate_id = ids[key]
+            positions[advocate_id] = positions.get(advocate_id, 0) + 1
+            links.append({
+                "cause_id": cause_id,
+                "advocate_id": advocate_id,
+                "hearing_date": hearing_date,
+                "source": source,
+                "position": positions[advocate_id],
+            })
+    if links:
+        db.execute(insert(CauseAdvocate.__table__), links)
+    return len(links)
+
+
+def rebuild(db: Session) -> int:
+    # Every list from scratch, one at a time in hearing order
+    db.query(CauseAdvocate).delete(synchronize_session=False)
+    db.commit()
+    total = 0
+    segments = db.query(Cause.source, Cause.hearing_date).distinct().order_by(Cause.hearing_date, Cause.source).all()
+    for number, (source, hearing_date) in enumerate(segments, 1):
+        started = time.perf_counter()
+        links = update_segment(db, source, hearing_date)
+        db.commit()
+        total += links
+        logger.info(f"[{number}/{len(segments)}] {source} {hearing_date}: {links} links in {time.perf_counter() - started:.2f}s")
+    return total
+
+
+if __name__ == "__main__":
+    from database import Base, SessionLocal, engine
+
+    parser = argparse.ArgumentParser(description="Rebuild the advocate index from the stored causes")
+    parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        print(f"✓ {rebuild(db)} cause-advocate links, {db.query(Advocate).count()} advocates")
+    finally:
+        db.close()
@@ -0,0 +1,72 @@
+import argparse
+import getpass
+import os
+import sys
+import time
+from datetime import datetime
+
+import requests
+
+# Submits a backfill to the running backend, which runs it as a scraper job
+# on the same queue as scheduled and manual scrapes, so the two never
+# overlap and /api/scraper/stop reaches it. Progress is checkpointed, so
+# submitting the same range again resumes where a stopped or crashed run
+# left off. Download workers and rate come from the backend's
+# SCRAPER_BACKFILL_WORKERS and SCRAPER_BACKFILL_REQUESTS_PER_SECOND.
+API_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+FINISHED_STATUSES = {"succeeded", "failed", "cancelled"}
+
+
+def parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Queue a scrape of every cause list in a date range on the running backend. Progress is "
+                    "checkpointed, so submitting the same range again resumes where it stopped."
+    )
+    parser.add_argument("--from", dest="date_from", type=parse_date, required=True, help="first hearing date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=parse_date, required=True, help="last hearing date (YYYY-MM-DD)")
+    parser.add_argument("--retry-missing", action="store_true", help="retry dates that had no cause list published")
+    parser.add_argument("--force", action="store_true", help="ignore checkpoints and re-fetch every date")
+    parser.add_argument("--url", default=API_URL, help="backend base URL (default $BACKEND_URL or %(default)s)")
+    parser.add_argument("--username", default=os.getenv("BACKFILL_USERNAME", "admin"), help="admin user to submit as")
+    parser.add_argument("--wait", action="store_true", help="wait for the job to finish and print its outcome")
+    args = parser.parse_args()
+
+    if args.date_from > args.date_to:
+        parser.error("--from must not be after --to")
+
+    password = os.getenv("BACKFILL_PASSWORD") or getpass.getpass(f"Password for {args.username}: ")
+    response = requests.post(
+        f"{args.url}/api/auth/token",
+        data={"username": args.username, "password": password},
+        timeout=30,
+    )
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = requests.post(
+        f"{args.url}/api/scraper/backfill",
+        params={
+            "date_from": args.date_from.isoformat(),
+            "date_to": args.date_to.isoformat(),
+            "force": args.force,
+            "retry_missing": args.retry_missing,
+        },
+        headers=headers,
+        timeout=30,
+    )
+    response.raise_for_status()
+    job_id = response.json()["job_id"]
+    print(f"✓ Backfill job {job_id} {response.json()['status']}")
+
+    while args.wait:
+        job = requests.get(f"{args.url}/api/scraper/jobs/{job_id}", headers=headers, timeout=30).json()
+        if job["status"] in FINISHED_STATUSES:
+            print(f"✓ Backfill job {job_id} {job['status']}: {job['records_extracted']} causes")
+            if job["error_message"]:
+                print(f"  {job['error_message']}")
+            sys.exit(0 if job["status"] == "succeeded" else 1)
+        time.sleep(5)
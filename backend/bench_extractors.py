@@ -0,0 +1,71 @@
+import argparse
+import glob
+import os
+import time
+from datetime import date
+
+from pdf_extract import EXTRACTORS, open_extractor
+from scraper import DIFF_FIELDS, cause_key, parse_pdf_content
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "attached_assets")
+REFERENCE_BACKEND = "pdfplumber"
+
+
+def keyed_causes(causes):
+    occurrences = {}
+    return {cause_key(c["court_no"], c["sr_no"], c["case_no"], occurrences): c for c in causes}
+
+
+def diff_causes(reference, candidate):
+    # Compare two parses by natural key: causes only one side found, and
+    # causes both found whose fields disagree
+    ref = keyed_causes(reference)
+    cand = keyed_causes(candidate)
+    changed = sum(
+        1 for key in ref.keys() & cand.keys()
+        if any(ref[key][f] != cand[key][f] for f in DIFF_FIELDS)
+    )
+    return {
+        "missing": len(ref.keys() - cand.keys()),
+        "extra": len(cand.keys() - ref.keys()),
+        "changed": changed,
+    }
+
+
+def bench_file(pdf_path, backends):
+    # Placeholder date; only the parsed rows are compared
+    hearing_date = date.today()
+    with open_extractor(pdf_path, REFERENCE_BACKEND) as extractor:
+        page_count = extractor.page_count()
+
+    results = {}
+    for backend in backends:
+        started = time.perf_counter()
+        causes = parse_pdf_content(pdf_path, hearing_date, workers=1, backend=backend)
+        elapsed = time.perf_counter() - started
+        results[backend] = {"causes": causes, "seconds": elapsed, "pages_per_sec": page_count / elapsed}
+
+    print(f"\n{os.path.basename(pdf_path)} ({page_count} pages)")
+    print(f"  {'backend':<12} {'seconds':>9} {'pages/s':>9} {'causes':>7} {'missing':>8} {'extra':>6} {'changed':>8}")
+    reference = results.get(REFERENCE_BACKEND)
+    for backend, result in results.items():
+        diff = diff_causes(reference["causes"], result["causes"]) if reference else None
+        print(
+            f"  {backend:<12} {result['seconds']:>9.2f} {result['pages_per_sec']:>9.1f} {len(result['causes']):>7}"
+            + (f" {diff['missing']:>8} {diff['extra']:>6} {diff['changed']:>8}" if diff else "")
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare PDF text extraction backends on speed and parsed output")
+    parser.add_argument("pdfs", nargs="*", help="PDFs to benchmark (default: attached_assets/*.pdf)")
+    parser.add_argument("--backends", nargs="+", default=list(EXTRACTORS), choices=list(EXTRACTORS))
+    args = parser.parse_args()
+
+    backends = args.backends
+    if REFERENCE_BACKEND not in backends:
+        # Diffs are always reported against pdfplumber
+        backends = [REFERENCE_BACKEND] + backends
+
+    for pdf_path in args.pdfs or sorted(glob.glob(os.path.join(ASSETS_DIR, "*.pdf"))):
+        bench_file(pdf_path, backends)
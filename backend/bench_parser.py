@@ -0,0 +1,245 @@
+import argparse
+import glob
+import gzip
+import json
+import multiprocessing
+import os
+import random
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from bench_extractors import ASSETS_DIR, diff_causes
+from pdf_extract import EXTRACTORS, PDF_EXTRACTOR
+from scraper import DIFF_FIELDS, iter_pdf_causes
+
+# Parser benchmark and regression check.
+#
+# Real lists in attached_assets/ are compared against golden snapshots in
+# bench_golden/ (regenerate with --update-golden after an intended parser
+# change). Synthetic lists are generated with reportlab at --base-pages
+# times each --scales factor, and checked against the causes the generator
+# wrote, so they need no snapshot.
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_golden")
+# Fixed so snapshots don't change with the day the benchmark runs
+HEARING_DATE = date(2025, 11, 24)
+SNAPSHOT_FIELDS = ["court_no", "sr_no", "case_no", *DIFF_FIELDS]
+
+# Word lists for synthetic causes. None of them contain an HRCE keyword,
+# "VS" or "(", which the parser treats specially.
+NAMES = [
+    "R.KUMAR", "S.LAKSHMI", "M.PRAKASH", "K.SELVI", "A.RAJAN", "P.GANESH", "T.MEENA",
+    "V.ANAND", "N.KARTHIK", "G.PRIYA", "B.SURESH", "J.REVATHI", "D.ARUN", "E.KANNAN",
+]
+ADVOCATES = ["M/S.", "Mr.", "Ms."]
+CASE_TYPES = ["Service", "Land.Ench.", "Gen. Misc.", "Taxes", "Education", "Police"]
+MAIN_CASES = ["WP", "WA", "CRP", "SA", "CMA"]
+CONNECTED_CASES = ["WMP", "CMP", "CRLMP"]
+RESPONDENTS = [
+    "THE DISTRICT COLLECTOR AND 3 OTHERS.",
+    "STATE OF TAMILNADU AND 2 OTHERS.",
+    "THE SECRETARY TO GOVERNMENT AND ANOTHER.",
+]
+HRCE_RESPONDENT = "THE COMMISSIONER, HINDU RELIGIOUS AND CHARITABLE ENDOWMENTS DEPARTMENT"
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 40
+LINE_HEIGHT = 12
+LINES_PER_PAGE = int((PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT)
+CAUSES_PER_COURT = 40
+
+
+def synthetic_cause_block(rng, sr_no, court_no, case_number):
+    # One serial number: a main case, sometimes followed by connected cases
+    # (both the "AND Stay" / number-on-the-same-line form and the bare "AND"
+    # form). Returns the printed lines and the causes the parser should find.
+    lines = []
+    expected = []
+    hrce = rng.random() < 0.1
+    respondent = HRCE_RESPONDENT if hrce else rng.choice(RESPONDENTS)
+    case_type = rng.choice(CASE_TYPES)
+
+    def add_case(first_line, case_no, petitioner, advocate, raw_text=None):
+        lines.extend([first_line, f"({case_type}) VS", respondent, "------------------"])
+        expected.append({
+            "court_no": f"COURT NO. {court_no}",
+            "sr_no": str(sr_no),
+            "case_no": case_no,
+            "petitioner": petitioner,
+            "respondent": respondent,
+            "advocate": advocate,
+            "case_type": case_type,
+            "raw_text": raw_text or first_line,
+            "is_hrce": hrce,
+        })
+
+    petitioner = rng.choice(NAMES)
+    advocate = f"{rng.choice(ADVOCATES)} {rng.choice(NAMES)}"
+    case_no = f"{rng.choice(MAIN_CASES)}/{case_number}/2025"
+    add_case(f"{sr_no} {case_no} {petitioner} {advocate}", case_no, petitioner, advocate)
+
+    for connected in range(rng.choice([0, 0, 1, 2])):
+        case_no = f"{rng.choice(CONNECTED_CASES)} {case_number + connected + 1}/2025"
+        if connected % 2:
+            # The parser records the bare "AND" line as the raw text
+            lines.append("AND")
+            add_case(f"{case_no} {petitioner} {advocate}", case_no, petitioner, advocate, "AND")
+        else:
+            lines.append("AND Stay")
+            add_case(f"{case_no} {petitioner} {advocate}", case_no, petitioner, advocate)
+
+    return lines, expected
+
+
+def generate_cause_list(pdf_path, page_count, seed=0):
+    """Write a synthetic cause list of page_count pages; return its expected causes."""
+    rng = random.Random(seed)
+    pdf = canvas.Canvas(pdf_path, pagesize=A4)
+    expected = []
+    pages_written = 0
+    page_lines = []
+    court_no = 0
+    sr_no = 0
+    case_number = 1000
+
+    def flush_page():
+        pdf.setFont("Helvetica", 9)
+        y = PAGE_HEIGHT - MARGIN
+        for line in page_lines:
+            pdf.drawString(MARGIN, y, line)
+            y -= LINE_HEIGHT
+        pdf.showPage()
+        page_lines.clear()
+
+    while pages_written < page_count:
+        if sr_no % CAUSES_PER_COURT == 0:
+            court_no += 1
+            block = [f"COURT NO. {court_no}"]
+            block_expected = []
+        else:
+            block = []
+            block_expected = []
+        sr_no += 1
+        case_number += 10
+        cause_lines, cause_expected = synthetic_cause_block(rng, sr_no, court_no, case_number)
+        block += cause_lines
+        block_expected += cause_expected
+
+        # Keep a serial number and its connected cases on one page, as the
+        # parser only links connected cases to a main case on the same page
+        if len(page_lines) + len(block) > LINES_PER_PAGE:
+            flush_page()
+            pages_written += 1
+            if pages_written == page_count:
+                break
+        page_lines.extend(block)
+        expected.extend(block_expected)
+
+    pdf.save()
+    return expected
+
+
+def snapshot_rows(causes):
+    return [{field: cause[field] for field in SNAPSHOT_FIELDS} for cause in causes]
+
+
+def golden_path(pdf_path):
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(GOLDEN_DIR, f"{name}.json.gz")
+
+
+def load_golden(pdf_path):
+    path = golden_path(pdf_path)
+    if not os.path.exists(path):
+        return None
+    with gzip.open(path, "rt") as f:
+        return json.load(f)
+
+
+def save_golden(pdf_path, causes):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with gzip.open(golden_path(pdf_path), "wt") as f:
+        json.dump(snapshot_rows(causes), f, indent=0)
+
+
+def run_parser(pdf_path, backend, workers):
+    started = time.perf_counter()
+    causes = list(iter_pdf_causes(pdf_path, HEARING_DATE, workers, backend))
+    return causes, time.perf_counter() - started
+
+
+def parse_peak_rss(pdf_path, backend, workers):
+    # Runs in a fresh process so ru_maxrss covers this parse alone, including
+    # memory the extractors allocate outside Python (PDFium, for one)
+    list(iter_pdf_causes(pdf_path, HEARING_DATE, workers, backend))
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def peak_memory(pdf_path, backend, workers):
+    # Separate pass so the timed run isn't affected. Parse worker processes
+    # aren't included, so this undercounts with --workers > 1.
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(parse_peak_rss, pdf_path, backend, workers).result()
+
+
+def bench(label, pdf_path, expected, backend, workers, measure_memory):
+    with EXTRACTORS[backend](pdf_path) as extractor:
+        page_count = extractor.page_count()
+    causes, seconds = run_parser(pdf_path, backend, workers)
+    peak = peak_memory(pdf_path, backend, workers) if measure_memory else None
+
+    if expected is None:
+        check = "no snapshot"
+    else:
+        diff = diff_causes(expected, snapshot_rows(causes))
+        if len(expected) == len(causes) and not any(diff.values()):
+            check = "ok"
+        else:
+            check = f"FAIL ({len(causes)}/{len(expected)} causes, {diff['missing']} missing, {diff['extra']} extra, {diff['changed']} changed)"
+
+    print(
+        f"  {label:<28} {page_count:>6} {seconds:>9.2f} {page_count / seconds:>9.1f} {len(causes) / seconds:>9.1f}"
+        f" {(f'{peak / 2**20:.1f}' if peak is not None else '-'):>9}  {check}"
+    )
+    return check in ("ok", "no snapshot")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the cause list parser and check it against golden snapshots")
+    parser.add_argument("pdfs", nargs="*", help="Real PDFs to check (default: attached_assets/*.pdf)")
+    parser.add_argument("--backend", default=PDF_EXTRACTOR, choices=list(EXTRACTORS))
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--base-pages", type=int, default=20, help="Page count of the 1x synthetic list")
+    parser.add_argument("--scales", type=int, nargs="*", default=[1, 10, 100], help="Synthetic list sizes, as multiples of --base-pages")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory pass")
+    parser.add_argument("--update-golden", action="store_true", help="Rewrite the snapshots of the real PDFs from this run")
+    args = parser.parse_args()
+
+    print(f"backend={args.backend} workers={args.workers}")
+    print(f"  {'list':<28} {'pages':>6} {'seconds':>9} {'pages/s':>9} {'causes/s':>9} {'RSS MiB':>9}  check")
+    passed = True
+
+    for pdf_path in args.pdfs or sorted(glob.glob(os.path.join(ASSETS_DIR, "*.pdf"))):
+        if args.update_golden:
+            causes, _ = run_parser(pdf_path, args.backend, args.workers)
+            save_golden(pdf_path, causes)
+            print(f"  updated {golden_path(pdf_path)} ({len(causes)} causes)")
+        label = os.path.basename(pdf_path)[:28]
+        passed &= bench(label, pdf_path, load_golden(pdf_path), args.backend, args.workers, not args.no_memory)
+
+    for scale in args.scales:
+        fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+        os.close(fd)
+        try:
+            expected = generate_cause_list(pdf_path, args.base_pages * scale)
+            passed &= bench(f"synthetic {scale}x", pdf_path, expected, args.backend, args.workers, not args.no_memory)
+        finally:
+            os.remove(pdf_path)
+
+    if not passed:
+        raise SystemExit(1)
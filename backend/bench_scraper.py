@@ -0,0 +1,89 @@
+import argparse
+import glob
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+
+from upstream_simulator import UpstreamSimulator
+
+# End-to-end scraper benchmark against upstream_simulator.py: serves one
+# fixture PDF for --days consecutive dates on every bench, runs a full
+# scrape_cause_list into a scratch SQLite database and reports dates/min.
+# Fault options are passed straight to the simulator.
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "attached_assets")
+
+
+def build_fixtures(fixtures_dir, pdf_path, start, days):
+    # Every date links to the same file; the scraper can't tell the difference
+    for offset in range(days):
+        name = f"cause_{(start + timedelta(days=offset)).strftime('%d%m%Y')}.pdf"
+        target = os.path.join(fixtures_dir, name)
+        try:
+            os.symlink(os.path.abspath(pdf_path), target)
+        except OSError:
+            shutil.copyfile(pdf_path, target)
+
+
+if __name__ == "__main__":
+    default_pdf = next(iter(sorted(glob.glob(os.path.join(ASSETS_DIR, "*modified*.pdf")))), None)
+
+    parser = argparse.ArgumentParser(description="Benchmark a full scrape against the local upstream simulator")
+    parser.add_argument("--pdf", default=default_pdf, help="fixture cause list served for every date")
+    parser.add_argument("--days", type=int, default=20, help="consecutive dates served per bench")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--bandwidth", type=int, default=0, help="bytes/s per PDF response (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", help="database to scrape into (default: a scratch SQLite file)")
+    args = parser.parse_args()
+    if not args.pdf:
+        parser.error("no fixture PDF found in attached_assets; pass --pdf")
+
+    work_dir = tempfile.mkdtemp(prefix="bench-scraper-")
+    fixtures_dir = os.path.join(work_dir, "fixtures")
+    os.makedirs(fixtures_dir)
+    build_fixtures(fixtures_dir, args.pdf, date(2025, 1, 1), args.days)
+
+    simulator = UpstreamSimulator(
+        fixtures_dir,
+        latency=args.latency,
+        jitter=args.jitter,
+        bandwidth=args.bandwidth,
+        error_rate=args.error_rate,
+        truncate_rate=args.truncate_rate,
+        seed=args.seed,
+    )
+    # Sources, the database and the archive read their settings at import,
+    # so these must be set before the scraper is imported
+    os.environ["SCRAPER_MHC_BASE_URL"] = simulator.url
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(work_dir, 'bench.db')}"
+    os.environ["CAUSE_LIST_ARCHIVE_DIR"] = ""
+
+    from database import Base, SessionLocal, engine
+    from scraper import RUN_METRICS, scrape_cause_list
+    from schema_upgrades import upgrade_schema
+
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema()
+    db = SessionLocal()
+    try:
+        with simulator:
+            started = time.perf_counter()
+            causes = scrape_cause_list(db, force=True)
+            elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    metrics = RUN_METRICS.snapshot()
+    print(f"dates:      {metrics['dates_done']}/{metrics['dates_total']}")
+    print(f"causes:     {causes}")
+    print(f"elapsed:    {elapsed:.2f}s")
+    print(f"dates/min:  {metrics['dates_done'] / elapsed * 60:.1f}")
+    print(f"stages:     {json.dumps(metrics['stage_seconds'])}")
+    print(f"upstream:   {json.dumps(simulator.stats)}")
@@ -0,0 +1,209 @@
+import logging
+import os
+import sys
+import threading
+import time
+
+from rapidfuzz import fuzz, process
+
+import search_cache
+from models import Cause, CauseSegment
+from search_index import FUZZY_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# In-process alternative to the database trigram index for fuzzy search
+# (FUZZY_SEARCH_BACKEND=memory). Keeps lowercased copies of the fuzzy
+# columns and scores a query against all of them in one rapidfuzz cdist
+# call spread over FUZZY_INDEX_WORKERS threads (-1 = every core), instead
+# of calling fuzz.ratio row by row. cdist returns numpy arrays, so this
+# backend needs numpy (the fuzzy-memory extra); check_backend fails
+# startup without it.
+#
+# Rows are held in (source, hearing_date) segments, which is the unit the
+# scraper ingests. Every write to causes, from any process, stamps the
+# segments it touched with the new ingest generation (cause_segments, see
+# search_cache.bump_generation). A refresh reloads only the segments
+# stamped since the generation it last saw, plus those marked stale in
+# this process, and is checked at most every FUZZY_INDEX_REFRESH_SECONDS.
+FUZZY_SEARCH_BACKEND = os.getenv("FUZZY_SEARCH_BACKEND", "database")
+FUZZY_INDEX_WORKERS = int(os.getenv("FUZZY_INDEX_WORKERS", "-1"))
+FUZZY_INDEX_REFRESH_SECONDS = float(os.getenv("FUZZY_INDEX_REFRESH_SECONDS", "30"))
+
+
+def segment_size(ids: list, columns: dict) -> int:
+    # Approximate bytes held: the lists plus every string in them
+    size = sys.getsizeof(ids) + sum(sys.getsizeof(i) for i in ids)
+    for values in columns.values():
+        size += sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+    return size
+
+
+class FuzzyIndex:
+    def __init__(self, workers: int = FUZZY_INDEX_WORKERS):
+        self.workers = workers
+        self._lock = threading.Lock()
+        # (source, hearing_date) -> (ids, {column: lowercased values}, bytes)
+        self._segments = {}
+        # Ingest generation the loaded segments are current as of
+        self._generation = 0
+        self._stale = set()
+        # Segments concatenated for scoring, rebuilt after any change
+        self._ids = None
+        self._columns = {}
+        self._checked_at = 0.0
+        self.built_at = None
+        self.refreshed_at = None
+        self.last_refresh_seconds = 0.0
+
+    @property
+    def built(self) -> bool:
+        return self._ids is not None
+
+    def mark_stale(self, source: str, hearing_date):
+        # Cheap enough to call on every write; a no-op until the index is built
+        with self._lock:
+            if self.built:
+                self._stale.add((source, hearing_date))
+
+    def refresh(self, db, force: bool = False):
+        """Build the index, or reload the segments that changed since the last refresh."""
+        with self._lock:
+            if self.built and not force and not self._stale and time.monotonic() - self._checked_at < FUZZY_INDEX_REFRESH_SECONDS:
+                return
+            started = time.perf_counter()
+            # Read before loading: a write landing mid-load is stamped with a
+            # later generation and picked up by the next refresh
+            generation = search_cache.current_generation(db)
+            if not self.built:
+                changed = None
+            else:
+                changed = set(self._stale)
+                if generation != self._generation:
+                    changed |= {
+                        (source, hearing_date)
+                        for source, hearing_date in db.query(CauseSegment.source, CauseSegment.hearing_date)
+                        .filter(CauseSegment.generation > self._generation)
+                    }
+            if changed is None or changed:
+                self._load(db, changed)
+                self._compile()
+                self.last_refresh_seconds = time.perf_counter() - started
+                logger.info(
+                    f"Fuzzy index {'built' if changed is None else f'refreshed {len(changed)} segment(s)'}: "
+                    f"{len(self._ids)} rows, {self.memory_bytes() / 1e6:.1f} MB in {self.last_refresh_seconds:.2f}s"
+                )
+                self.refreshed_at = time.time()
+                if changed is None:
+                    self.built_at = self.refreshed_at
+            self._generation = generation
+            self._stale = set()
+            self._checked_at = time.monotonic()
+
+    def _load(self, db, keys: set | None):
+        # keys=None loads every row; otherwise just those segments, dropping
+        # any that no longer have rows
+        query = db.query(Cause.id, Cause.source, Cause.hearing_date, *(getattr(Cause, c) for c in FUZZY_COLUMNS))
+        if keys is None:
+            self._segments = {}
+            batches = [query]
+        else:
+            for key in keys:
+                self._segments.pop(key, None)
+            dates = sorted({hearing_date for _, hearing_date in keys}, key=str)
+            batches = [query.filter(Cause.hearing_date.in_(dates[i:i + 500])) for i in range(0, len(dates), 500)]
+
+        loaded = {}
+        for batch in batches:
+            for row_id, source, hearing_date, *values in batch.order_by(Cause.id).yield_per(10000):
+                key = (source, hearing_date)
+                if keys is not None and key not in keys:
+                    continue
+                ids, columns = loaded.setdefault(key, ([], {c: [] for c in FUZZY_COLUMNS}))
+                ids.append(row_id)
+                for column, value in zip(FUZZY_COLUMNS, values):
+                    columns[column].append(value.lower() if value else "")
+        for key, (ids, columns) in loaded.items():
+            self._segments[key] = (ids, columns, segment_size(ids, columns))
+
+    def _compile(self):
+        import numpy as np
+
+        segments = list(self._segments.values())
+        self._ids = np.array([i for ids, _, _ in segments for i in ids], dtype=np.int64)
+        self._columns = {c: [v for _, columns, _ in segments for v in columns[c]] for c in FUZZY_COLUMNS}
+
+    def memory_bytes(self) -> int:
+        # Segment data plus the concatenated lists (which share its strings)
+        if not self.built:
+            return 0
+        return (
+            sum(size for _, _, size in self._segments.values())
+            + self._ids.nbytes
+            + sum(sys.getsizeof(values) for values in self._columns.values())
+        )
+
+    def match(self, db, fields: dict, min_ratios: dict, min_average: float = 0.7) -> list:
+        """Ids of causes matching fields ({column: value}) the way fuzzy search scores them.
+
+        A field counts when its fuzz.ratio beats min_ratios[column]; a cause
+        matches when at least one field counts and those fields average
+        above min_average.
+        """
+        import numpy as np
+
+        self.refresh(db)
+        with self._lock:
+            ids, columns = self._ids, self._columns
+
+        total = np.zeros(len(ids), dtype=np.float32)
+        counted = np.zeros(len(ids), dtype=np.int32)
+        for column, value in fields.items():
+            # Each stored value is a "query" row here, so cdist can spread
+            # the rows over its workers; scores below the cutoff come back 0
+            scores = process.cdist(
+                columns[column],
+                [value.lower()],
+                scorer=fuzz.ratio,
+                score_cutoff=min_ratios[column] * 100,
+                workers=self.workers,
+            )[:, 0] / 100
+            hit = scores > min_ratios[column]
+            total += np.where(hit, scores, 0)
+            counted += hit
+        return ids[(counted > 0) & (total > min_average * counted)].tolist()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": FUZZY_SEARCH_BACKEND,
+                "built": self.built,
+                "rows": len(self._ids) if self.built else 0,
+                "segments": len(self._segments),
+                "memory_bytes": self.memory_bytes(),
+                "built_at": self.built_at,
+                "refreshed_at": self.refreshed_at,
+                "last_refresh_seconds": round(self.last_refresh_seconds, 3),
+            }
+
+
+FUZZY_INDEX = FuzzyIndex()
+
+
+def is_enabled() -> bool:
+    return FUZZY_SEARCH_BACKEND == "memory"
+
+
+def check_backend():
+    # Called at startup, so a misconfigured backend fails there rather than
+    # on the first fuzzy search
+    if FUZZY_SEARCH_BACKEND not in ("database", "memory"):
+        raise ValueError(f"Unknown FUZZY_SEARCH_BACKEND '{FUZZY_SEARCH_BACKEND}'. Available: database, memory")
+    if FUZZY_SEARCH_BACKEND == "memory":
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "FUZZY_SEARCH_BACKEND=memory needs numpy. Install the fuzzy-memory extra "
+                "(uv sync --extra fuzzy-memory) or pip install numpy."
+            ) from None
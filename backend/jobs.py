@@ -0,0 +1,140 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from database import SessionLocal
+from models import ScraperJob, ScraperJobStatus
+from scraper import get_run_log, run_backfill, run_scraper, stop_scraper
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = [ScraperJobStatus.QUEUED, ScraperJobStatus.RUNNING]
+
+# Scrapes and backfills run one at a time on a dedicated thread, outside
+# any HTTP request. Jobs submitted while another is running wait in the
+# queue, so two triggers never scrape at the same time.
+executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper-job")
+_submit_lock = threading.Lock()
+
+
+def matches(column, value):
+    return column == value if value is not None else column.is_(None)
+
+
+def submit_job(
+    db: Session,
+    target_date: date | None = None,
+    force: bool = False,
+    requested_by: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    retry_missing: bool = False,
+) -> ScraperJob:
+    # With date_from and date_to the job is a backfill of that range, which
+    # resumes from its checkpoints. A trigger identical to a job that is
+    # still queued or running gets that job back.
+    with _submit_lock:
+        job = (
+            db.query(ScraperJob)
+            .filter(
+                ScraperJob.status.in_(ACTIVE_STATUSES),
+                matches(ScraperJob.target_date, target_date),
+                matches(ScraperJob.date_from, date_from),
+                matches(ScraperJob.date_to, date_to),
+                ScraperJob.retry_missing == retry_missing,
+                ScraperJob.force == force,
+            )
+            .first()
+        )
+        if job:
+            return job
+
+        job = ScraperJob(
+            target_date=target_date,
+            date_from=date_from,
+            date_to=date_to,
+            retry_missing=retry_missing,
+            force=force,
+            requested_by=requested_by,
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+    executor.submit(run_job, job.id)
+    return job
+
+
+def run_job(job_id: int):
+    db = SessionLocal()
+    try:
+        job = db.query(ScraperJob).filter(ScraperJob.id == job_id).first()
+        if not job or job.status != ScraperJobStatus.QUEUED:
+            # Cancelled while it was waiting
+            return
+
+        job.status = ScraperJobStatus.RUNNING
+        job.started_at = func.now()
+        db.commit()
+
+        try:
+            if job.date_from:
+                records_count = run_backfill(db, job.date_from, job.date_to, force=job.force, retry_missing=job.retry_missing)
+            else:
+                records_count = run_scraper(db, job.target_date, job.force)
+            # Pick up a cancel requested from another session while running
+            db.refresh(job)
+            job.records_extracted = records_count
+            job.status = ScraperJobStatus.CANCELLED if job.cancel_requested else ScraperJobStatus.SUCCEEDED
+        except Exception as e:
+            logger.error(f"Scraper job {job_id} failed: {str(e)}")
+            db.rollback()
+            job.status = ScraperJobStatus.FAILED
+            job.error_message = str(e)
+
+        # The whole run, not just the progress view's last 50 lines, so a
+        # failure's log survives (capped by SCRAPER_JOB_LOG_MAX_LINES)
+        job.log_output = get_run_log()
+        job.finished_at = func.now()
+        db.commit()
+    finally:
+        db.close()
+
+
+def cancel_job(db: Session, job: ScraperJob) -> ScraperJob:
+    if job.status == ScraperJobStatus.QUEUED:
+        job.status = ScraperJobStatus.CANCELLED
+        job.finished_at = func.now()
+    elif job.status == ScraperJobStatus.RUNNING:
+        job.cancel_requested = True
+        stop_scraper()
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_running_job(db: Session) -> ScraperJob | None:
+    return db.query(ScraperJob).filter(ScraperJob.status == ScraperJobStatus.RUNNING).first()
+
+
+def recover_interrupted_jobs():
+    # Jobs live in this process's executor; any still active at startup
+    # belonged to a process that has since exited
+    db = SessionLocal()
+    try:
+        for job in db.query(ScraperJob).filter(ScraperJob.status.in_(ACTIVE_STATUSES)):
+            job.status = ScraperJobStatus.FAILED
+            job.error_message = "Interrupted by server restart"
+            job.finished_at = func.now()
+        db.commit()
+    finally:
+        db.close()
+
+
+def shutdown():
+    stop_scraper()
+    executor.shutdown(wait=False, cancel_futures=True)
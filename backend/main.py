@@ -7,8 +7,10 @@ from apscheduler.triggers.cron import CronTrigger
 import logging
 
 from database import engine, Base, SessionLocal
-from routers import cases, scraper, auth, admin
-from scraper import run_scraper
+from routers import cases, scraper, auth, admin, advocates
+import fuzzy_index
+import jobs
+from schema_upgrades import upgrade_schema
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,12 +19,11 @@ scheduler = BackgroundScheduler()
 
 
 def scheduled_scraper_job():
-    """Run the scraper as a scheduled job"""
+    """Queue the daily scrape on the same job executor as manual triggers"""
     db = SessionLocal()
     try:
-        logger.info("Running scheduled scraper job...")
-        records_count = run_scraper(db)
-        logger.info(f"Scheduled scraper completed: {records_count} records extracted")
+        job = jobs.submit_job(db, requested_by="scheduler")
+        logger.info(f"Scheduled scraper job {job.id} queued")
     except Exception as e:
         logger.error(f"Scheduled scraper failed: {str(e)}")
     finally:
@@ -31,7 +32,11 @@ def scheduled_scraper_job():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    fuzzy_index.check_backend()
     Base.metadata.create_all(bind=engine)
+    for step in upgrade_schema():
+        logger.info(f"Schema upgrade: {step}")
+    jobs.recover_interrupted_jobs()
     
     scheduler.add_job(
         scheduled_scraper_job,
@@ -46,6 +51,7 @@ async def lifespan(app: FastAPI):
     yield
     
     scheduler.shutdown()
+    jobs.shutdown()
     logger.info("APScheduler shut down")
 
 
@@ -68,6 +74,7 @@ app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(cases.router, prefix="/api/cases", tags=["Cases"])
 app.include_router(scraper.router, prefix="/api/scraper", tags=["Scraper"])
 app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+app.include_router(advocates.router, prefix="/api/advocates", tags=["Advocates"])
 
 
 @app.get("/")
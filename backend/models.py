@@ -1,7 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Time, DateTime, Boolean, Enum
+from sqlalchemy import Column, Integer, BigInteger, Float, String, Text, Date, Time, DateTime, Boolean, Enum, Index, UniqueConstraint
+from sqlalchemy.orm import validates
 from sqlalchemy.sql import func
 from database import Base
 import enum
+import re
 
 
 class UserRole(str, enum.Enum):
@@ -16,6 +18,20 @@ class ScraperStatus(str, enum.Enum):
     RUNNING = "running"
 
 
+class ScraperJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class BackfillStatus(str, enum.Enum):
+    DONE = "done"
+    MISSING = "missing"
+    FAILED = "failed"
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -28,13 +44,83 @@ class User(Base):
     is_active = Column(Boolean, default=True)
 
 
+# "COURT NO. 05 A", "5a" and "5 A" are all court (5, "A")
+court_no_pattern = re.compile(r"^\s*(?:COURT\s*NO\.?\s*)?0*(\d+)\s*([A-Z]?)\s*$", re.IGNORECASE)
+
+
+def court_key(court_no: str | None) -> tuple:
+    """(number, suffix) for a court as listed or typed; (None, "") if it isn't one."""
+    match = court_no_pattern.match(court_no or "")
+    if not match:
+        return None, ""
+    return int(match.group(1)), match.group(2).upper()
+
+
+def court_columns(court_no: str | None) -> dict:
+    # The canonical court columns for a court_no, for bulk writes that skip
+    # the Cause validators
+    number, suffix = court_key(court_no)
+    return {"court_number": number, "court_suffix": suffix}
+
+
+# "W.P. No. 12345 of 2024", "WP/12345/2024" and "wp 12345/2024" are all
+# case ("WP", 12345, 2024). A "No" is only taken as such after a separator,
+# so a type can't lose a trailing "NO".
+case_no_pattern = re.compile(
+    r"^\s*(?P<type>[A-Z][A-Z.()\s]*?)[\s./-]*(?:(?<=[\s./])NO\.?)?[\s./-]*"
+    r"(?P<number>\d+)\s*(?:/|-|\bOF\b)\s*(?P<year>\d{4})\s*$",
+    re.IGNORECASE,
+)
+
+
+def case_no_key(case_no: str | None) -> tuple:
+    """(type, number, year) for a case number in any common spelling; (None, None, None) if it isn't one."""
+    match = case_no_pattern.match(case_no or "")
+    if not match:
+        return None, None, None
+    case_type = re.sub(r"[^A-Z]", "", match.group("type").upper())
+    return case_type, int(match.group("number")), int(match.group("year"))
+
+
+def sr_number(sr_no: str | None) -> int | None:
+    # Serial numbers are stored as text; this is the number, for ordering
+    sr_no = (sr_no or "").strip()
+    return int(sr_no) if sr_no.isdigit() else None
+
+
+def sr_no_columns(sr_no: str | None) -> dict:
+    return {"sr_number": sr_number(sr_no)}
+
+
+def case_no_columns(case_no: str | None) -> dict:
+    # Same as court_columns, for the case number
+    case_type, number, year = case_no_key(case_no)
+    return {"case_no_type": case_type, "case_no_number": number, "case_no_year": year}
+
+
 class Cause(Base):
     __tablename__ = "causes"
+    __table_args__ = (
+        # Order of keyset-paginated search results (/api/cases/search/page)
+        Index("ix_causes_search_order", "hearing_date", "court_number", "court_suffix", "sr_number", "id"),
+        Index("ix_causes_court", "court_number", "court_suffix"),
+        # Exact case number lookups (/api/cases/lookup), latest hearing first
+        Index("ix_causes_case_no_key", "case_no_type", "case_no_number", "case_no_year", "hearing_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     sr_no = Column(String(50), index=True)
+    # sr_no as a number (None if it isn't one), so lists sort 2 before 10
+    sr_number = Column(Integer)
     court_no = Column(String(50), index=True)
+    # court_no as listed, normalized by court_key; filters and sorting use these
+    court_number = Column(Integer)
+    court_suffix = Column(String(5), default="", server_default="", nullable=False)
     case_no = Column(String(100), index=True)
+    # case_no as listed, normalized by case_no_key
+    case_no_type = Column(String(30))
+    case_no_number = Column(Integer)
+    case_no_year = Column(Integer)
     petitioner = Column(Text)
     respondent = Column(Text)
     advocate = Column(String(255), index=True)
@@ -43,9 +129,55 @@ class Cause(Base):
     case_type = Column(String(100), index=True)
     raw_text = Column(Text)
     is_hrce = Column(Boolean, default=False, index=True)
+    # Which bench's list the cause came from (see sources.SOURCES)
+    source = Column(String(50), default="madras", server_default="madras", nullable=False, index=True)
     inserted_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    @validates("court_no")
+    def validate_court_no(self, key, court_no):
+        self.court_number, self.court_suffix = court_key(court_no)
+        return court_no
+
+    @validates("sr_no")
+    def validate_sr_no(self, key, sr_no):
+        self.sr_number = sr_number(sr_no)
+        return sr_no
+
+    @validates("case_no")
+    def validate_case_no(self, key, case_no):
+        self.case_no_type, self.case_no_number, self.case_no_year = case_no_key(case_no)
+        return case_no
+
+
+class CauseStaging(Base):
+    # Changes to one (source, hearing_date) list, written batch by batch as
+    # the list is parsed and applied to causes in one transaction once it is
+    # whole (scraper.finish_ingest). cause_id is the row an update is for,
+    # None for a new cause.
+    __tablename__ = "cause_staging"
+    __table_args__ = (Index("ix_cause_staging_segment", "source", "hearing_date", "cause_id"),)
+
+    id = Column(Integer, primary_key=True)
+    source = Column(String(50), nullable=False)
+    hearing_date = Column(Date, nullable=False)
+    cause_id = Column(Integer)
+    sr_no = Column(String(50))
+    sr_number = Column(Integer)
+    court_no = Column(String(50))
+    court_number = Column(Integer)
+    court_suffix = Column(String(5))
+    case_no = Column(String(100))
+    case_no_type = Column(String(30))
+    case_no_number = Column(Integer)
+    case_no_year = Column(Integer)
+    petitioner = Column(Text)
+    respondent = Column(Text)
+    advocate = Column(String(255))
+    case_type = Column(String(100))
+    raw_text = Column(Text)
+    is_hrce = Column(Boolean)
+
 
 class ScraperLog(Base):
     __tablename__ = "scraper_logs"
@@ -56,3 +188,128 @@ class ScraperLog(Base):
     error_message = Column(Text)
     run_date = Column(Date, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CauseListManifest(Base):
+    __tablename__ = "cause_list_manifests"
+    __table_args__ = (UniqueConstraint("source", "hearing_date", name="uq_cause_list_manifests_source_date"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(50), default="madras", server_default="madras", nullable=False)
+    hearing_date = Column(Date, index=True, nullable=False)
+    url = Column(String(255), nullable=False)
+    etag = Column(String(255))
+    last_modified = Column(String(100))
+    content_length = Column(Integer)
+    content_hash = Column(String(64))
+    causes_count = Column(Integer, default=0)
+    fetched_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class ScraperJob(Base):
+    __tablename__ = "scraper_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(Enum(ScraperJobStatus), default=ScraperJobStatus.QUEUED, nullable=False, index=True)
+    target_date = Column(Date)
+    # A backfill of every date in [date_from, date_to] (scraper.run_backfill)
+    date_from = Column(Date)
+    date_to = Column(Date)
+    retry_missing = Column(Boolean, default=False)
+    force = Column(Boolean, default=False)
+    requested_by = Column(String(100))
+    records_extracted = Column(Integer, default=0)
+    error_message = Column(Text)
+    log_output = Column(Text)
+    cancel_requested = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+
+class BackfillCheckpoint(Base):
+    __tablename__ = "backfill_checkpoints"
+    __table_args__ = (UniqueConstraint("source", "hearing_date", name="uq_backfill_checkpoints_source_date"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(50), default="madras", server_default="madras", nullable=False)
+    hearing_date = Column(Date, index=True, nullable=False)
+    status = Column(Enum(BackfillStatus), nullable=False)
+    causes_count = Column(Integer, default=0)
+    attempts = Column(Integer, default=0)
+    error_message = Column(Text)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class CauseNameBand(Base):
+    # MinHash LSH band keys of a cause's party and advocate names; causes
+    # sharing a key are candidates for related_causes (see related_cases.py)
+    __tablename__ = "cause_name_bands"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cause_id = Column(Integer, index=True, nullable=False)
+    band_key = Column(BigInteger, index=True, nullable=False)
+
+
+class RelatedCause(Base):
+    # Top-k scored edges of the related-case graph, one row per direction
+    __tablename__ = "related_causes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cause_id = Column(Integer, index=True, nullable=False)
+    related_id = Column(Integer, index=True, nullable=False)
+    score = Column(Float, nullable=False)
+    reason = Column(String(50), nullable=False)
+
+
+class Advocate(Base):
+    # One advocate as named on the lists; name_key is advocates.advocate_key
+    # of the name, so "M/S. S.SEKAR" and "Mr. S. Sekar" are one row
+    __tablename__ = "advocates"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name_key = Column(String(255), unique=True, index=True, nullable=False)
+    name = Column(String(255), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CauseAdvocate(Base):
+    # Cause-to-advocate links, and with them each advocate's list for a
+    # hearing date: position is the cause's place in court and serial order
+    # on that date, rebuilt when the date is ingested (see advocates.py)
+    __tablename__ = "cause_advocates"
+    __table_args__ = (
+        Index("ix_cause_advocates_daily_list", "advocate_id", "hearing_date", "position"),
+        Index("ix_cause_advocates_segment", "hearing_date", "source"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    cause_id = Column(Integer, index=True, nullable=False)
+    advocate_id = Column(Integer, nullable=False)
+    hearing_date = Column(Date, nullable=False)
+    source = Column(String(50), nullable=False)
+    position = Column(Integer, nullable=False)
+
+
+class IngestGeneration(Base):
+    # Single row counting writes to causes; cached search results are keyed
+    # by it, so bumping it invalidates them in every process
+    __tablename__ = "ingest_generation"
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class CauseSegment(Base):
+    # The generation of the last write to each (source, hearing_date) list,
+    # stamped by search_cache.bump_generation, so the in-memory fuzzy index
+    # reloads just the lists written since it last looked, by any process
+    __tablename__ = "cause_segments"
+    __table_args__ = (UniqueConstraint("source", "hearing_date", name="uq_cause_segments_source_date"),)
+
+    id = Column(Integer, primary_key=True)
+    source = Column(String(50), nullable=False)
+    hearing_date = Column(Date, nullable=False)
+    generation = Column(BigInteger, nullable=False, index=True)
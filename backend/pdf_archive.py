@@ -0,0 +1,119 @@
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import date, datetime
+
+from sources import DEFAULT_SOURCE
+
+# Content-addressed store of every cause list PDF we have downloaded.
+#
+#   <ARCHIVE_DIR>/objects/ab/abcdef....pdf.gz   gzip'd PDF, named by the SHA-256 of the raw bytes
+#   <ARCHIVE_DIR>/refs/2025-11-24               one "<sha256> <fetched-at>" line per version seen
+#   <ARCHIVE_DIR>/refs/madurai/2025-11-24       the same, for sources other than the default
+#
+# Identical PDFs are stored once no matter how many runs fetch them, and
+# the refs let a date range be re-parsed later without touching the network.
+# Set CAUSE_LIST_ARCHIVE_DIR to an empty string to disable archiving.
+ARCHIVE_DIR = os.getenv("CAUSE_LIST_ARCHIVE_DIR", "./cause_list_archive")
+
+
+def is_enabled() -> bool:
+    return bool(ARCHIVE_DIR)
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _object_path(content_hash: str) -> str:
+    return os.path.join(ARCHIVE_DIR, "objects", content_hash[:2], f"{content_hash}.pdf.gz")
+
+
+def _refs_dir(source: str) -> str:
+    # The default source keeps the layout from before there were sources
+    if source == DEFAULT_SOURCE:
+        return os.path.join(ARCHIVE_DIR, "refs")
+    return os.path.join(ARCHIVE_DIR, "refs", source)
+
+
+def _ref_path(hearing_date: date, source: str) -> str:
+    return os.path.join(_refs_dir(source), hearing_date.strftime("%Y-%m-%d"))
+
+
+def _read_refs(hearing_date: date, source: str) -> list:
+    path = _ref_path(hearing_date, source)
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [line.split()[0] for line in f if line.strip()]
+
+
+def archive_pdf(pdf_path: str, hearing_date: date, content_hash: str | None = None, source: str = DEFAULT_SOURCE) -> str:
+    """Store a downloaded PDF in the archive and return its content hash."""
+    content_hash = content_hash or hash_file(pdf_path)
+    object_path = _object_path(content_hash)
+
+    if not os.path.exists(object_path):
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        # Write to a temp file first so a crash never leaves a truncated object
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(object_path), suffix=".tmp")
+        try:
+            with open(pdf_path, "rb") as src, os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, object_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    refs = _read_refs(hearing_date, source)
+    if not refs or refs[-1] != content_hash:
+        os.makedirs(_refs_dir(source), exist_ok=True)
+        with open(_ref_path(hearing_date, source), "a") as f:
+            f.write(f"{content_hash} {datetime.now().isoformat(timespec='seconds')}\n")
+
+    return content_hash
+
+
+def latest_archived_hash(hearing_date: date, source: str = DEFAULT_SOURCE) -> str | None:
+    refs = _read_refs(hearing_date, source)
+    return refs[-1] if refs else None
+
+
+def restore_pdf(content_hash: str) -> str:
+    """Decompress an archived PDF to a temp file; the caller removes it."""
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as dst, gzip.open(_object_path(content_hash), "rb") as src:
+            shutil.copyfileobj(src, dst)
+    except BaseException:
+        # A missing or corrupt object leaves no temp file behind
+        os.remove(path)
+        raise
+    return path
+
+
+def list_archived_dates(date_from: date | None = None, date_to: date | None = None, source: str = DEFAULT_SOURCE) -> list:
+    """Archived hearing dates of a source in [date_from, date_to], oldest first."""
+    refs_dir = _refs_dir(source)
+    if not os.path.isdir(refs_dir):
+        return []
+
+    dates = []
+    for name in os.listdir(refs_dir):
+        try:
+            hearing_date = datetime.strptime(name, "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        if date_from and hearing_date < date_from:
+            continue
+        if date_to and hearing_date > date_to:
+            continue
+        dates.append(hearing_date)
+    return sorted(dates)
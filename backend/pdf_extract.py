@@ -0,0 +1,124 @@
+import os
+import re
+
+import pdfplumber
+
+# Text extraction backends for cause list PDFs. Every backend yields one
+# newline-separated string per page, laid out the way pdfplumber lays it
+# out, which is what the line parser in scraper.py expects. pdfplumber is
+# the reference; pypdfium2 wraps PDFium's C++ text extraction and is much
+# faster. Run bench_extractors.py to compare them on real lists.
+PDF_EXTRACTOR = os.getenv("SCRAPER_PDF_EXTRACTOR", "pdfplumber")
+
+# Same vertical tolerance pdfplumber uses to put characters on one line
+LINE_Y_TOLERANCE = 3
+# PDFium ends each text run with CRLF, or with U+FFFE where a word was hyphenated
+pdfium_run_break = re.compile("\r\n|\ufffe")
+
+
+class PdfplumberExtractor:
+    name = "pdfplumber"
+
+    def __init__(self, pdf_path: str):
+        self.pdf = pdfplumber.open(pdf_path)
+
+    def page_count(self) -> int:
+        return len(self.pdf.pages)
+
+    def iter_page_texts(self, start: int = 0, end: int | None = None):
+        for page in self.pdf.pages[start:end]:
+            text = page.extract_text()
+            # Drop pdfplumber's cached layout objects once a page has been read,
+            # otherwise every page of a long list stays resident until close
+            if hasattr(page, "close"):
+                page.close()
+            else:
+                page.flush_cache()
+            yield text
+
+    def close(self):
+        self.pdf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Pypdfium2Extractor:
+    name = "pypdfium2"
+
+    def __init__(self, pdf_path: str):
+        import pypdfium2
+
+        self.pdf = pypdfium2.PdfDocument(pdf_path)
+
+    def page_count(self) -> int:
+        return len(self.pdf)
+
+    def iter_page_texts(self, start: int = 0, end: int | None = None):
+        end = self.page_count() if end is None else min(end, self.page_count())
+        for index in range(start, end):
+            page = self.pdf[index]
+            textpage = page.get_textpage()
+            try:
+                yield self.layout_text(textpage)
+            finally:
+                textpage.close()
+                page.close()
+
+    @staticmethod
+    def layout_text(textpage) -> str:
+        # PDFium returns text in content-stream order, which for the cause
+        # list tables means cell by cell. Rebuild pdfplumber-style lines by
+        # placing each text run at the loose (font-height) box of its first
+        # character, grouping runs that sit on the same line and joining
+        # them left to right.
+        text = textpage.get_text_range()
+        runs = []
+        start = 0
+        for match in [*pdfium_run_break.finditer(text), None]:
+            end = match.start() if match else len(text)
+            run = text[start:end]
+            if match and match.group() == "\ufffe":
+                run += "-"
+            stripped = run.strip()
+            if stripped:
+                left, _, _, top = textpage.get_charbox(start + len(run) - len(run.lstrip()), loose=True)
+                runs.append((-top, left, stripped))
+            start = match.end() if match else end
+
+        # Top to bottom; a run within the tolerance of the previous one continues its line
+        runs.sort()
+        lines = []
+        previous_y = None
+        for y, left, run in runs:
+            if previous_y is not None and y - previous_y <= LINE_Y_TOLERANCE:
+                lines[-1].append((left, run))
+            else:
+                lines.append([(left, run)])
+            previous_y = y
+        return "\n".join(" ".join(run for _, run in sorted(line)) for line in lines)
+
+    def close(self):
+        self.pdf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+EXTRACTORS = {
+    PdfplumberExtractor.name: PdfplumberExtractor,
+    Pypdfium2Extractor.name: Pypdfium2Extractor,
+}
+
+
+def open_extractor(pdf_path: str, backend: str | None = None):
+    backend = backend or PDF_EXTRACTOR
+    if backend not in EXTRACTORS:
+        raise ValueError(f"Unknown PDF extractor '{backend}'. Available: {', '.join(EXTRACTORS)}")
+    return EXTRACTORS[backend](pdf_path)
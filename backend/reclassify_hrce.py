@@ -0,0 +1,11 @@
+from database import SessionLocal
+from scraper import reclassify_hrce
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        print("Re-evaluating HRCE flags for all causes...")
+        changed = reclassify_hrce(db)
+        print(f"✓ {changed} causes reclassified")
+    finally:
+        db.close()
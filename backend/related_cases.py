@@ -0,0 +1,260 @@
+import argparse
+import hashlib
+import logging
+import os
+import random
+import re
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+
+from rapidfuzz import fuzz
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from models import Cause, CauseNameBand, RelatedCause
+
+logger = logging.getLogger(__name__)
+
+# Precomputed related-case graph behind GET /api/cases/{id}/related.
+#
+# Each cause's petitioner, respondent and advocate names get a MinHash
+# signature over character trigrams, cut into RELATED_LSH_BANDS bands of
+# RELATED_LSH_ROWS values. Every band is stored as a key in
+# cause_name_bands; causes sharing a key (same column, same band) are
+# candidates. Only candidates are scored with fuzz.ratio, using the rules
+# the endpoint used to apply to the whole table, and each cause keeps its
+# RELATED_TOP_K best edges in related_causes.
+#
+# A bucket for a common name (a busy advocate) can hold thousands of
+# causes; only the RELATED_BUCKET_CAP most recent of them are candidates,
+# and only the RELATED_CANDIDATES sharing the most keys get scored.
+#
+# Changing the band settings changes every key: run this file to rebuild.
+RELATED_TOP_K = int(os.getenv("RELATED_TOP_K", "10"))
+RELATED_LSH_BANDS = int(os.getenv("RELATED_LSH_BANDS", "16"))
+RELATED_LSH_ROWS = int(os.getenv("RELATED_LSH_ROWS", "2"))
+RELATED_BUCKET_CAP = int(os.getenv("RELATED_BUCKET_CAP", "50"))
+RELATED_CANDIDATES = int(os.getenv("RELATED_CANDIDATES", "100"))
+
+# (column, fuzz.ratio it must beat, reason shown to the user)
+RELATED_FIELDS = [
+    ("petitioner", 0.75, "Similar petitioner name"),
+    ("respondent", 0.75, "Similar respondent name"),
+    ("advocate", 0.8, "Same advocate"),
+]
+MIN_SCORE = 0.75
+
+# One XOR mask per MinHash permutation (XOR is a bijection on the 32-bit
+# shingle hashes). Seeded, so every process computes the same keys.
+_rng = random.Random(20250101)
+_MASKS = [_rng.getrandbits(32) for _ in range(RELATED_LSH_BANDS * RELATED_LSH_ROWS)]
+
+BATCH_SIZE = 500
+
+
+def minhash(value: str) -> tuple:
+    shingles = {zlib.crc32(value[i:i + 3].encode()) for i in range(max(1, len(value) - 2))}
+    return tuple(min(h ^ mask for h in shingles) for mask in _MASKS)
+
+
+@lru_cache(maxsize=65536)
+def band_keys(column: str, value: str) -> tuple:
+    # Names repeat a lot across lists (advocates especially), hence the cache
+    signature = minhash(re.sub(r"\s+", " ", value).strip())
+    keys = []
+    for band in range(RELATED_LSH_BANDS):
+        rows = signature[band * RELATED_LSH_ROWS:(band + 1) * RELATED_LSH_ROWS]
+        digest = hashlib.blake2b(f"{column}:{band}:{rows}".encode(), digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return tuple(keys)
+
+
+def score_pair(names: tuple, other: tuple) -> tuple | None:
+    # Best-scoring column for two causes' lowercased names as (score, reason), or None
+    best_score, best_reason = 0, ""
+    for name, other_name, (_, threshold, reason) in zip(names, other, RELATED_FIELDS):
+        if name and other_name:
+            score = fuzz.ratio(name, other_name) / 100.0
+            if score > best_score and score > threshold:
+                best_score, best_reason = score, reason
+    return (best_score, best_reason) if best_score > MIN_SCORE else None
+
+
+def load_names(db: Session, cause_ids) -> dict:
+    # cause id -> lowercased names in RELATED_FIELDS order
+    names = {}
+    cause_ids = list(cause_ids)
+    for i in range(0, len(cause_ids), BATCH_SIZE):
+        rows = db.query(Cause.id, *(getattr(Cause, c) for c, _, _ in RELATED_FIELDS)).filter(
+            Cause.id.in_(cause_ids[i:i + BATCH_SIZE])
+        )
+        for row_id, *values in rows:
+            names[row_id] = tuple(value.lower() if value else None for value in values)
+    return names
+
+
+def remove_causes(db: Session, cause_ids):
+    """Drop the band keys and edges of cause_ids (deleted or about to be recomputed)."""
+    cause_ids = list(cause_ids)
+    for i in range(0, len(cause_ids), BATCH_SIZE):
+        ids = cause_ids[i:i + BATCH_SIZE]
+        db.query(CauseNameBand).filter(CauseNameBand.cause_id.in_(ids)).delete(synchronize_session=False)
+        db.query(RelatedCause).filter(RelatedCause.cause_id.in_(ids)).delete(synchronize_session=False)
+        db.query(RelatedCause).filter(RelatedCause.related_id.in_(ids)).delete(synchronize_session=False)
+
+
+def bucket_members(db: Session, keys) -> dict:
+    # band_key -> most recent RELATED_BUCKET_CAP cause ids holding it
+    members = {}
+    keys = list(keys)
+    for i in range(0, len(keys), BATCH_SIZE):
+        ranked = (
+            select(
+                CauseNameBand.band_key,
+                CauseNameBand.cause_id,
+                func.row_number()
+                .over(partition_by=CauseNameBand.band_key, order_by=CauseNameBand.cause_id.desc())
+                .label("rank"),
+            )
+            .where(CauseNameBand.band_key.in_(keys[i:i + BATCH_SIZE]))
+            .subquery()
+        )
+        for band_key, cause_id in db.execute(
+            select(ranked.c.band_key, ranked.c.cause_id).where(ranked.c.rank <= RELATED_BUCKET_CAP)
+        ):
+            members.setdefault(band_key, []).append(cause_id)
+    return members
+
+
+def update_related(db: Session, cause_ids) -> int:
+    """Recompute band keys and top-k edges for cause_ids; returns the edges written.
+
+    Causes outside cause_ids gain an edge when a new one makes their top
+    k. Everything is read and scored before the first write, so the
+    transaction (a lock on SQLite) is held only for the writes at the
+    end. The caller commits.
+    """
+    cause_ids = set(cause_ids)
+    names = load_names(db, cause_ids)
+
+    keys_by_cause = {}
+    bands = []
+    for cause_id, cause_names in names.items():
+        keys = {
+            key
+            for (column, _, _), name in zip(RELATED_FIELDS, cause_names)
+            if name
+            for key in band_keys(column, name)
+        }
+        keys_by_cause[cause_id] = keys
+        bands.extend({"cause_id": cause_id, "band_key": key} for key in keys)
+
+    # Buckets as they will be once the new keys are in: the stored keys of
+    # cause_ids are about to be replaced, so theirs are swapped for the new
+    members = bucket_members(db, {key for keys in keys_by_cause.values() for key in keys})
+    for key in members:
+        members[key] = [other for other in members[key] if other not in cause_ids]
+    for cause_id, keys in keys_by_cause.items():
+        for key in keys:
+            members.setdefault(key, []).append(cause_id)
+    for key, bucket in members.items():
+        members[key] = sorted(bucket, reverse=True)[:RELATED_BUCKET_CAP]
+
+    candidates = {}
+    for cause_id, keys in keys_by_cause.items():
+        shared = Counter(other for key in keys for other in members.get(key, ()) if other != cause_id)
+        candidates[cause_id] = [other for other, _ in shared.most_common(RELATED_CANDIDATES)]
+    others = {other for found in candidates.values() for other in found} - names.keys()
+    all_names = {**names, **load_names(db, others)}
+
+    edges = []
+    incoming = {}
+    # The same pair of names turns up again and again (one advocate, many causes)
+    pair_scores = {}
+    for cause_id, found in candidates.items():
+        scored = []
+        for other in found:
+            if other not in all_names:
+                continue
+            pair = (names[cause_id], all_names[other])
+            if pair not in pair_scores:
+                pair_scores[pair] = score_pair(*pair)
+            if match := pair_scores[pair]:
+                scored.append((match[0], other, match[1]))
+                if other not in names:
+                    incoming.setdefault(other, []).append((match[0], cause_id, match[1]))
+        scored.sort(reverse=True)
+        edges.extend(
+            {"cause_id": cause_id, "related_id": other, "score": score, "reason": reason}
+            for score, other, reason in scored[:RELATED_TOP_K]
+        )
+
+    # A new cause only goes into an existing cause's list if it beats the
+    # edges already there (less those into cause_ids, which are replaced)
+    displaced = []
+    incoming_ids = list(incoming)
+    for i in range(0, len(incoming_ids), BATCH_SIZE):
+        existing = {}
+        rows = db.query(
+            RelatedCause.id, RelatedCause.cause_id, RelatedCause.related_id, RelatedCause.score, RelatedCause.reason
+        ).filter(RelatedCause.cause_id.in_(incoming_ids[i:i + BATCH_SIZE]))
+        for edge_id, cause_id, related_id, score, reason in rows:
+            if related_id not in cause_ids:
+                existing.setdefault(cause_id, []).append((score, related_id, reason, edge_id))
+        for cause_id in incoming_ids[i:i + BATCH_SIZE]:
+            offered = [(score, other, reason, None) for score, other, reason in incoming[cause_id]]
+            ranked = sorted(existing.get(cause_id, []) + offered, key=lambda e: (e[0], e[1]), reverse=True)
+            displaced.extend(edge_id for _, _, _, edge_id in ranked[RELATED_TOP_K:] if edge_id is not None)
+            edges.extend(
+                {"cause_id": cause_id, "related_id": other, "score": score, "reason": reason}
+                for score, other, reason, edge_id in ranked[:RELATED_TOP_K]
+                if edge_id is None
+            )
+
+    remove_causes(db, cause_ids)
+    for i in range(0, len(displaced), BATCH_SIZE):
+        db.query(RelatedCause).filter(RelatedCause.id.in_(displaced[i:i + BATCH_SIZE])).delete(synchronize_session=False)
+    if bands:
+        db.execute(insert(CauseNameBand.__table__), bands)
+    if edges:
+        db.execute(insert(RelatedCause.__table__), edges)
+    return len(edges)
+
+
+def update_segment(db: Session, source: str, hearing_date) -> int:
+    # Recompute every cause on one ingested list
+    cause_ids = [row_id for row_id, in db.query(Cause.id).filter(Cause.source == source, Cause.hearing_date == hearing_date)]
+    return update_related(db, cause_ids)
+
+
+def rebuild(db: Session) -> int:
+    # Whole graph from scratch, one list at a time in hearing order
+    db.query(CauseNameBand).delete(synchronize_session=False)
+    db.query(RelatedCause).delete(synchronize_session=False)
+    db.commit()
+    total = 0
+    segments = db.query(Cause.source, Cause.hearing_date).distinct().order_by(Cause.hearing_date, Cause.source).all()
+    for number, (source, hearing_date) in enumerate(segments, 1):
+        started = time.perf_counter()
+        edges = update_segment(db, source, hearing_date)
+        db.commit()
+        total += edges
+        logger.info(f"[{number}/{len(segments)}] {source} {hearing_date}: {edges} edges in {time.perf_counter() - started:.2f}s")
+    return total
+
+
+if __name__ == "__main__":
+    from database import Base, SessionLocal, engine
+
+    parser = argparse.ArgumentParser(description="Rebuild the related-case graph from the stored causes")
+    parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        print(f"✓ {rebuild(db)} related-case edges")
+    finally:
+        db.close()
@@ -0,0 +1,28 @@
+import argparse
+from datetime import datetime
+
+from database import SessionLocal, engine, Base
+from schema_upgrades import upgrade_schema
+from scraper import replay_archive
+from sources import DEFAULT_SOURCE, SOURCES
+
+
+def parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-parse archived cause list PDFs without downloading them again")
+    parser.add_argument("--from", dest="date_from", type=parse_date, help="first hearing date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=parse_date, help="last hearing date (YYYY-MM-DD)")
+    parser.add_argument("--source", default=DEFAULT_SOURCE, choices=list(SOURCES), help="bench whose archive to replay")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema()
+    db = SessionLocal()
+    try:
+        total = replay_archive(db, args.date_from, args.date_to, args.source)
+        print(f"✓ Replayed {total} causes")
+    finally:
+        db.close()
@@ -6,6 +6,10 @@ from database import get_db
 from models import User, UserRole, Cause
 from schemas import UserAdminResponse, CauseResponse, CauseCreate, UserUpdateRole
 from routers.auth import get_current_user
+from fuzzy_index import FUZZY_INDEX
+import advocates
+import related_cases
+import search_cache
 
 router = APIRouter()
 
@@ -77,9 +81,20 @@ async def update_cause(
     if not cause:
         raise HTTPException(status_code=404, detail="Cause not found")
     
+    FUZZY_INDEX.mark_stale(cause.source, cause.hearing_date)
+    segments = {(cause.source, cause.hearing_date)}
     for field, value in cause_data.model_dump(exclude_unset=True).items():
         setattr(cause, field, value)
     
+    db.flush()
+    # The cause may have moved to another list, or within one
+    segments.add((cause.source, cause.hearing_date))
+    for source, hearing_date in segments:
+        advocates.update_segment(db, source, hearing_date)
+    search_cache.bump_generation(db, segments)
+    db.commit()
+    FUZZY_INDEX.mark_stale(cause.source, cause.hearing_date)
+    related_cases.update_related(db, [cause.id])
     db.commit()
     db.refresh(cause)
     return cause
@@ -97,6 +112,27 @@ async def delete_cause(
     if not cause:
         raise HTTPException(status_code=404, detail="Cause not found")
     
+    related_cases.remove_causes(db, [cause.id])
+    advocates.remove_causes(db, [cause.id])
     db.delete(cause)
+    search_cache.bump_generation(db, [(cause.source, cause.hearing_date)])
     db.commit()
+    FUZZY_INDEX.mark_stale(cause.source, cause.hearing_date)
     return {"message": "Cause deleted successfully"}
+
+
+@router.get("/fuzzy-index")
+async def get_fuzzy_index_stats(
+    current_user: User = Depends(get_current_user)
+):
+    check_superadmin(current_user)
+    return FUZZY_INDEX.stats()
+
+
+@router.get("/search-cache")
+async def get_search_cache_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    check_superadmin(current_user)
+    return {**search_cache.SEARCH_CACHE.stats(), "generation": search_cache.current_generation(db)}
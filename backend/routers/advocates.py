@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import date
+
+from database import get_db
+from models import Advocate, Cause, CauseAdvocate, User
+from schemas import AdvocateHearings, AdvocateResponse
+from routers.auth import get_current_user
+from advocates import advocate_key
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[AdvocateResponse])
+async def find_advocates(
+    name: str,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    # Advocates whose key starts with the key of name, as a range on the
+    # unique name_key index ("s. sek" finds "S. SEKAR")
+    key = advocate_key(name)
+    if not key:
+        return []
+    return (
+        db.query(Advocate)
+        .filter(Advocate.name_key >= key, Advocate.name_key < key + "~")
+        .order_by(Advocate.name_key)
+        .limit(min(limit, 100))
+        .all()
+    )
+
+
+@router.get("/hearings", response_model=AdvocateHearings)
+async def get_advocate_hearings(
+    hearing_date: date,
+    name: str = None,
+    advocate_id: int = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    # One advocate's causes for a hearing date, read from the list
+    # precomputed at ingest (advocates.py). The advocate is given by id,
+    # or by name in any spelling the lists use.
+    if advocate_id is not None:
+        advocate = db.query(Advocate).filter(Advocate.id == advocate_id).first()
+    elif name:
+        advocate = db.query(Advocate).filter(Advocate.name_key == advocate_key(name)).first()
+    else:
+        raise HTTPException(status_code=400, detail="Give an advocate name or advocate_id")
+    if not advocate:
+        raise HTTPException(status_code=404, detail="Advocate not found")
+
+    causes = (
+        db.query(Cause)
+        .join(CauseAdvocate, CauseAdvocate.cause_id == Cause.id)
+        .filter(CauseAdvocate.advocate_id == advocate.id, CauseAdvocate.hearing_date == hearing_date)
+        .order_by(CauseAdvocate.source, CauseAdvocate.position)
+        .all()
+    )
+    return AdvocateHearings(advocate=advocate, hearing_date=hearing_date, causes=causes)
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import and_, bindparam, false, or_
 from typing import List, Optional
+from pydantic import TypeAdapter
 from rapidfuzz import fuzz
 from datetime import date
+import base64
+import json
 from io import BytesIO
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, landscape
@@ -12,12 +15,18 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet
 
 from database import get_db
-from models import Cause, User
-from schemas import CauseResponse, CauseSearchParams, RelatedCase
+from models import Cause, RelatedCause, User, case_no_key, court_key
+from schemas import CausePage, CauseResponse, CauseSearchParams, RelatedCase
 from routers.auth import get_current_user
+import fuzzy_index
+import search_cache
+import search_index
+from search_cache import SEARCH_CACHE
 
 router = APIRouter()
 
+cause_list_adapter = TypeAdapter(List[CauseResponse])
+
 
 def calculate_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
@@ -25,6 +34,172 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return fuzz.ratio(text1.lower(), text2.lower()) / 100.0
 
 
+def filter_by_query(query_obj, db: Session, query: str, rank: bool = False):
+    # Served by the full-text index when there is one, else an ILIKE scan
+    indexed = search_index.match_causes(query_obj, db, query, rank)
+    if indexed is not None:
+        return indexed
+    return query_obj.filter(
+        or_(
+            Cause.case_no.ilike(f"%{query}%"),
+            Cause.petitioner.ilike(f"%{query}%"),
+            Cause.respondent.ilike(f"%{query}%"),
+            Cause.advocate.ilike(f"%{query}%"),
+            Cause.raw_text.ilike(f"%{query}%")
+        )
+    )
+
+
+def apply_text_filters(query_obj, db: Session, query, case_no, petitioner, respondent, advocate, rank: bool = False):
+    if query:
+        query_obj = filter_by_query(query_obj, db, query, rank)
+
+    if case_no:
+        query_obj = query_obj.filter(Cause.case_no.ilike(f"%{case_no}%"))
+    if petitioner:
+        query_obj = query_obj.filter(Cause.petitioner.ilike(f"%{petitioner}%"))
+    if respondent:
+        query_obj = query_obj.filter(Cause.respondent.ilike(f"%{respondent}%"))
+    if advocate:
+        query_obj = query_obj.filter(Cause.advocate.ilike(f"%{advocate}%"))
+    return query_obj
+
+
+def apply_filters(query_obj, court_no, hearing_date_from, hearing_date_to, case_type, is_hrce, source):
+    if court_no:
+        # "1", "01", "COURT NO. 1" all mean court (1, ""); anything else has
+        # to match court_no as stored
+        number, suffix = court_key(court_no)
+        if number is None:
+            query_obj = query_obj.filter(Cause.court_no == court_no)
+        else:
+            query_obj = query_obj.filter(Cause.court_number == number, Cause.court_suffix == suffix)
+
+    if hearing_date_from:
+        query_obj = query_obj.filter(Cause.hearing_date >= hearing_date_from)
+    if hearing_date_to:
+        query_obj = query_obj.filter(Cause.hearing_date <= hearing_date_to)
+    if case_type:
+        query_obj = query_obj.filter(Cause.case_type.ilike(f"%{case_type}%"))
+    if is_hrce is not None:
+        query_obj = query_obj.filter(Cause.is_hrce == is_hrce)
+    if source:
+        query_obj = query_obj.filter(Cause.source == source)
+    return query_obj
+
+
+# Per-field rapidfuzz thresholds for fuzzy search
+FUZZY_THRESHOLDS = {"case_no": 0.6, "petitioner": 0.7, "respondent": 0.7, "advocate": 0.7}
+
+
+def fuzzy_match(query_obj, db: Session, fields: dict, limit: int | None = None) -> list:
+    # The trigram index narrows the rows down to candidates in the database;
+    # rapidfuzz makes the final call on each of them. With limit, rows are
+    # read in query_obj's order and reading stops once enough have matched.
+    fields = {column: value for column, value in fields.items() if value}
+    if fuzzy_index.is_enabled():
+        # Scored in memory over every row; the SQL filters run on the matches
+        ids = fuzzy_index.FUZZY_INDEX.match(db, fields, FUZZY_THRESHOLDS)
+        # Inlined rather than bound: SQLite caps the number of parameters
+        query_obj = query_obj.filter(Cause.id.in_(bindparam("fuzzy_ids", ids, expanding=True, literal_execute=True)))
+        return (query_obj.limit(limit) if limit else query_obj).all()
+
+    candidates = search_index.fuzzy_candidates(query_obj, db, fields, FUZZY_THRESHOLDS)
+    results = []
+
+    for cause in (candidates if candidates is not None else query_obj).yield_per(500):
+        score = 0
+        matches = 0
+
+        for column, value in fields.items():
+            if getattr(cause, column):
+                s = calculate_similarity(value, getattr(cause, column))
+                if s > FUZZY_THRESHOLDS[column]:
+                    score += s
+                    matches += 1
+
+        if matches > 0 and (score / matches) > 0.7:
+            results.append(cause)
+            if limit and len(results) >= limit:
+                break
+    return results
+
+
+def clean_param(value: str | None, lower: bool = False) -> str | None:
+    # A text parameter stripped, None if nothing is left. lower for the ones
+    # matched regardless of case (ILIKE, the full-text and fuzzy indexes),
+    # so "A.Rajan " and "a.rajan" are one cache entry and one query.
+    if value is None:
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    return value.lower() if lower else value
+
+
+def clean_search_params(query, case_no, petitioner, respondent, advocate, court_no, case_type, source) -> tuple:
+    return (
+        *(clean_param(value, lower=True) for value in (query, case_no, petitioner, respondent, advocate)),
+        clean_param(court_no),
+        clean_param(case_type, lower=True),
+        clean_param(source),
+    )
+
+
+# Keyset pagination order for /search/page; the cursor is the last row's key
+SEARCH_ORDER = [Cause.hearing_date, Cause.court_number, Cause.court_suffix, Cause.sr_number, Cause.id]
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(cause: Cause) -> str:
+    key = [
+        cause.hearing_date.isoformat() if cause.hearing_date else None,
+        cause.court_number,
+        cause.court_suffix,
+        cause.sr_number,
+        cause.id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        hearing_date, court_number, court_suffix, sr_number, cause_id = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        return [
+            date.fromisoformat(hearing_date) if hearing_date else None,
+            int(court_number) if court_number is not None else None,
+            court_suffix,
+            int(sr_number) if sr_number is not None else None,
+            int(cause_id),
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def after_cursor(query_obj, db: Session, key: list):
+    # Rows strictly after key in SEARCH_ORDER. Built out column by column
+    # because NULLs don't compare; they sort first on SQLite and last on
+    # PostgreSQL, and the order has to be the one the index gives.
+    nulls_first = db.bind.dialect.name == "sqlite"
+    condition = None
+    for column, value in reversed(list(zip(SEARCH_ORDER, key))):
+        if value is None:
+            greater = column.isnot(None) if nulls_first else false()
+            equal = column.is_(None)
+        else:
+            greater = column > value if nulls_first else or_(column > value, column.is_(None))
+            equal = column == value
+        condition = greater if condition is None else or_(greater, and_(equal, condition))
+    if key[0] is not None:
+        # Redundant, but gives the planner a range on the leading column
+        first = SEARCH_ORDER[0] >= key[0]
+        condition = and_(first if nulls_first else or_(first, SEARCH_ORDER[0].is_(None)), condition)
+    return query_obj.filter(condition)
+
+
 @router.get("/search", response_model=List[CauseResponse])
 async def search_causes(
     query: str = None,
@@ -37,174 +212,156 @@ async def search_causes(
     hearing_date_to: date = None,
     case_type: str = None,
     is_hrce: bool = None,
+    source: str = None,
     fuzzy: bool = False,
+    rank: bool = False,
     limit: int = 1000,
     offset: int = 0,
     db: Session = Depends(get_db)
 ):
+    # Served from the cache until the next write to causes. The cache key
+    # and the query take the same cleaned parameters.
+    query, case_no, petitioner, respondent, advocate, court_no, case_type, source = clean_search_params(
+        query, case_no, petitioner, respondent, advocate, court_no, case_type, source
+    )
+    cache_key = search_cache.cache_key(
+        "search",
+        search_cache.current_generation(db),
+        query=query,
+        case_no=case_no,
+        petitioner=petitioner,
+        respondent=respondent,
+        advocate=advocate,
+        court_no=court_no,
+        hearing_date_from=hearing_date_from,
+        hearing_date_to=hearing_date_to,
+        case_type=case_type,
+        is_hrce=is_hrce,
+        source=source,
+        fuzzy=fuzzy,
+        rank=rank,
+        limit=limit,
+        offset=offset,
+    )
+    cached = SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     query_obj = db.query(Cause)
     
     if fuzzy and (case_no or petitioner or respondent or advocate):
-        all_causes = query_obj.all()
-        results = []
-        
-        for cause in all_causes:
-            score = 0
-            matches = 0
-            
-            if case_no and cause.case_no:
-                s = calculate_similarity(case_no, cause.case_no)
-                if s > 0.6:
-                    score += s
-                    matches += 1
-            
-            if petitioner and cause.petitioner:
-                s = calculate_similarity(petitioner, cause.petitioner)
-                if s > 0.7:
-                    score += s
-                    matches += 1
-            
-            if respondent and cause.respondent:
-                s = calculate_similarity(respondent, cause.respondent)
-                if s > 0.7:
-                    score += s
-                    matches += 1
-            
-            if advocate and cause.advocate:
-                s = calculate_similarity(advocate, cause.advocate)
-                if s > 0.7:
-                    score += s
-                    matches += 1
-            
-            if matches > 0 and (score / matches) > 0.7:
-                results.append(cause)
-        
-        if court_no:
-            # Flexible filtering for fuzzy search results
-            filtered_results = []
-            for c in results:
-                if c.court_no == court_no:
-                    filtered_results.append(c)
-                elif c.court_no and c.court_no.lower() == f"court no. {court_no}".lower():
-                    filtered_results.append(c)
-                elif c.court_no and len(court_no) == 1 and court_no.isdigit() and c.court_no.lower() == f"court no. 0{court_no}".lower():
-                    filtered_results.append(c)
-            results = filtered_results
-            
-        if hearing_date_from:
-            results = [c for c in results if c.hearing_date and c.hearing_date >= hearing_date_from]
-        if hearing_date_to:
-            results = [c for c in results if c.hearing_date and c.hearing_date <= hearing_date_to]
-        if case_type:
-            results = [c for c in results if c.case_type == case_type]
-        if is_hrce is not None:
-            results = [c for c in results if c.is_hrce == is_hrce]
-        
-        return results[offset:offset+limit]
+        query_obj = apply_filters(query_obj, court_no, hearing_date_from, hearing_date_to, case_type, is_hrce, source)
+        results = fuzzy_match(
+            query_obj, db, {"case_no": case_no, "petitioner": petitioner, "respondent": respondent, "advocate": advocate}
+        )
+        results = results[offset:offset+limit]
     
     else:
-        if query:
-            query_obj = query_obj.filter(
-                or_(
-                    Cause.case_no.ilike(f"%{query}%"),
-                    Cause.petitioner.ilike(f"%{query}%"),
-                    Cause.respondent.ilike(f"%{query}%"),
-                    Cause.advocate.ilike(f"%{query}%"),
-                    Cause.raw_text.ilike(f"%{query}%")
-                )
-            )
-        
-        if case_no:
-            query_obj = query_obj.filter(Cause.case_no.ilike(f"%{case_no}%"))
-        if petitioner:
-            query_obj = query_obj.filter(Cause.petitioner.ilike(f"%{petitioner}%"))
-        if respondent:
-            query_obj = query_obj.filter(Cause.respondent.ilike(f"%{respondent}%"))
-        if advocate:
-            query_obj = query_obj.filter(Cause.advocate.ilike(f"%{advocate}%"))
-        if court_no:
-            # Handle flexible court number searching
-            # Matches: "1", "01", "COURT NO. 1", "COURT NO. 01"
-            court_filters = [
-                Cause.court_no == court_no,
-                Cause.court_no.ilike(f"COURT NO. {court_no}"),
-                Cause.court_no.ilike(f"COURT NO. 0{court_no}") if len(court_no) == 1 and court_no.isdigit() else None
-            ]
-            # Filter out None values
-            court_filters = [f for f in court_filters if f is not None]
-            query_obj = query_obj.filter(or_(*court_filters))
-            
-        if hearing_date_from:
-            query_obj = query_obj.filter(Cause.hearing_date >= hearing_date_from)
-        if hearing_date_to:
-            query_obj = query_obj.filter(Cause.hearing_date <= hearing_date_to)
-        if case_type:
-            query_obj = query_obj.filter(Cause.case_type.ilike(f"%{case_type}%"))
-        if is_hrce is not None:
-            query_obj = query_obj.filter(Cause.is_hrce == is_hrce)
+        query_obj = apply_text_filters(query_obj, db, query, case_no, petitioner, respondent, advocate, rank)
+        query_obj = apply_filters(query_obj, court_no, hearing_date_from, hearing_date_to, case_type, is_hrce, source)
         
         results = query_obj.offset(offset).limit(limit).all()
-        return results
 
+    payload = cause_list_adapter.dump_json(cause_list_adapter.validate_python(results, from_attributes=True))
+    SEARCH_CACHE.set(cache_key, payload)
+    return Response(content=payload, media_type="application/json")
 
-@router.get("/{cause_id}", response_model=CauseResponse)
-async def get_cause(
-    cause_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+
+@router.get("/search/page", response_model=CausePage)
+async def search_causes_page(
+    query: str = None,
+    case_no: str = None,
+    petitioner: str = None,
+    respondent: str = None,
+    advocate: str = None,
+    court_no: str = None,
+    hearing_date_from: date = None,
+    hearing_date_to: date = None,
+    case_type: str = None,
+    is_hrce: bool = None,
+    source: str = None,
+    fuzzy: bool = False,
+    cursor: str = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    db: Session = Depends(get_db)
 ):
-    cause = db.query(Cause).filter(Cause.id == cause_id).first()
-    if not cause:
-        raise HTTPException(status_code=404, detail="Cause not found")
-    return cause
+    # Same filters as /search, paged by key instead of offset, so a deep
+    # page costs the same as the first
+    page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+    query, case_no, petitioner, respondent, advocate, court_no, case_type, source = clean_search_params(
+        query, case_no, petitioner, respondent, advocate, court_no, case_type, source
+    )
+    cache_key = search_cache.cache_key(
+        "search_page",
+        search_cache.current_generation(db),
+        query=query,
+        case_no=case_no,
+        petitioner=petitioner,
+        respondent=respondent,
+        advocate=advocate,
+        court_no=court_no,
+        hearing_date_from=hearing_date_from,
+        hearing_date_to=hearing_date_to,
+        case_type=case_type,
+        is_hrce=is_hrce,
+        source=source,
+        fuzzy=fuzzy,
+        cursor=cursor,
+        page_size=page_size,
+    )
+    cached = SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
+    query_obj = apply_filters(db.query(Cause), court_no, hearing_date_from, hearing_date_to, case_type, is_hrce, source)
+    if cursor:
+        query_obj = after_cursor(query_obj, db, decode_cursor(cursor))
+    query_obj = query_obj.order_by(*SEARCH_ORDER)
 
-@router.get("/{cause_id}/related", response_model=List[RelatedCase])
-async def get_related_causes(
-    cause_id: int,
+    # One extra row tells whether there is a next page
+    if fuzzy and (case_no or petitioner or respondent or advocate):
+        results = fuzzy_match(
+            query_obj,
+            db,
+            {"case_no": case_no, "petitioner": petitioner, "respondent": respondent, "advocate": advocate},
+            limit=page_size + 1,
+        )
+    else:
+        query_obj = apply_text_filters(query_obj, db, query, case_no, petitioner, respondent, advocate)
+        results = query_obj.limit(page_size + 1).all()
+
+    items = results[:page_size]
+    next_cursor = encode_cursor(items[-1]) if len(results) > page_size else None
+    payload = CausePage(items=items, next_cursor=next_cursor).model_dump_json().encode()
+    SEARCH_CACHE.set(cache_key, payload)
+    return Response(content=payload, media_type="application/json")
+
+
+@router.get("/lookup", response_model=List[CauseResponse])
+async def lookup_case(
+    case_no: str,
+    source: str = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    cause = db.query(Cause).filter(Cause.id == cause_id).first()
-    if not cause:
-        raise HTTPException(status_code=404, detail="Cause not found")
-    
-    all_causes = db.query(Cause).filter(Cause.id != cause_id).all()
-    related = []
-    
-    for other_cause in all_causes:
-        max_score = 0
-        reason = ""
-        
-        if cause.petitioner and other_cause.petitioner:
-            pet_score = calculate_similarity(cause.petitioner, other_cause.petitioner)
-            if pet_score > max_score and pet_score > 0.75:
-                max_score = pet_score
-                reason = "Similar petitioner name"
-        
-        if cause.respondent and other_cause.respondent:
-            res_score = calculate_similarity(cause.respondent, other_cause.respondent)
-            if res_score > max_score and res_score > 0.75:
-                max_score = res_score
-                reason = "Similar respondent name"
-        
-        if cause.advocate and other_cause.advocate:
-            adv_score = calculate_similarity(cause.advocate, other_cause.advocate)
-            if adv_score > max_score and adv_score > 0.8:
-                max_score = adv_score
-                reason = "Same advocate"
-        
-        if max_score > 0.75:
-            related.append(RelatedCase(
-                cause=other_cause,
-                similarity_score=max_score,
-                match_reason=reason
-            ))
-    
-    related.sort(key=lambda x: x.similarity_score, reverse=True)
-    return related[:10]
+    # Every listing of one case, latest hearing first. case_no can be any
+    # spelling case_no_key understands ("W.P. No. 12345 of 2024",
+    # "WP/12345/2024"); the lookup is a seek on ix_causes_case_no_key.
+    case_type, number, year = case_no_key(case_no)
+    if case_type is None:
+        raise HTTPException(status_code=400, detail=f"Unrecognized case number '{case_no}'")
+    query_obj = db.query(Cause).filter(
+        Cause.case_no_type == case_type,
+        Cause.case_no_number == number,
+        Cause.case_no_year == year,
+    )
+    if source:
+        query_obj = query_obj.filter(Cause.source == source)
+    return query_obj.order_by(Cause.hearing_date.desc(), Cause.id.desc()).all()
 
 
+# Declared before /{cause_id}, which would otherwise take "download-pdf"
+# as an id and answer 422
 @router.get("/download-pdf")
 async def download_causes_pdf(
     query: str = None,
@@ -217,7 +374,9 @@ async def download_causes_pdf(
     hearing_date_to: date = None,
     case_type: str = None,
     is_hrce: bool = None,
+    source: str = None,
     fuzzy: bool = False,
+    rank: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -228,98 +387,13 @@ async def download_causes_pdf(
         causes = []
         
         if fuzzy and (case_no or petitioner or respondent or advocate):
-            all_causes = query_obj.all()
-            results = []
-            
-            for cause in all_causes:
-                score = 0
-                matches = 0
-                
-                if case_no and cause.case_no:
-                    s = calculate_similarity(case_no, cause.case_no)
-                    if s > 0.6:
-                        score += s
-                        matches += 1
-                
-                if petitioner and cause.petitioner:
-                    s = calculate_similarity(petitioner, cause.petitioner)
-                    if s > 0.7:
-                        score += s
-                        matches += 1
-                
-                if respondent and cause.respondent:
-                    s = calculate_similarity(respondent, cause.respondent)
-                    if s > 0.7:
-                        score += s
-                        matches += 1
-                
-                if advocate and cause.advocate:
-                    s = calculate_similarity(advocate, cause.advocate)
-                    if s > 0.7:
-                        score += s
-                        matches += 1
-                
-                if matches > 0 and (score / matches) > 0.7:
-                    results.append(cause)
-            
-            if court_no:
-                filtered_results = []
-                for c in results:
-                    if c.court_no == court_no:
-                        filtered_results.append(c)
-                    elif c.court_no and c.court_no.lower() == f"court no. {court_no}".lower():
-                        filtered_results.append(c)
-                    elif c.court_no and len(court_no) == 1 and court_no.isdigit() and c.court_no.lower() == f"court no. 0{court_no}".lower():
-                        filtered_results.append(c)
-                results = filtered_results
-                
-            if hearing_date_from:
-                results = [c for c in results if c.hearing_date and c.hearing_date >= hearing_date_from]
-            if hearing_date_to:
-                results = [c for c in results if c.hearing_date and c.hearing_date <= hearing_date_to]
-            if case_type:
-                results = [c for c in results if c.case_type == case_type]
-            if is_hrce is not None:
-                results = [c for c in results if c.is_hrce == is_hrce]
-            
-            causes = results
+            query_obj = apply_filters(query_obj, court_no, hearing_date_from, hearing_date_to, case_type, is_hrce, source)
+            causes = fuzzy_match(
+                query_obj, db, {"case_no": case_no, "petitioner": petitioner, "respondent": respondent, "advocate": advocate}
+            )
         else:
-            if query:
-                query_obj = query_obj.filter(
-                    or_(
-                        Cause.case_no.ilike(f"%{query}%"),
-                        Cause.petitioner.ilike(f"%{query}%"),
-                        Cause.respondent.ilike(f"%{query}%"),
-                        Cause.advocate.ilike(f"%{query}%"),
-                        Cause.raw_text.ilike(f"%{query}%")
-                    )
-                )
-            
-            if case_no:
-                query_obj = query_obj.filter(Cause.case_no.ilike(f"%{case_no}%"))
-            if petitioner:
-                query_obj = query_obj.filter(Cause.petitioner.ilike(f"%{petitioner}%"))
-            if respondent:
-                query_obj = query_obj.filter(Cause.respondent.ilike(f"%{respondent}%"))
-            if advocate:
-                query_obj = query_obj.filter(Cause.advocate.ilike(f"%{advocate}%"))
-            if court_no:
-                court_filters = [
-                    Cause.court_no == court_no,
-                    Cause.court_no.ilike(f"COURT NO. {court_no}"),
-                    Cause.court_no.ilike(f"COURT NO. 0{court_no}") if len(court_no) == 1 and court_no.isdigit() else None
-                ]
-                court_filters = [f for f in court_filters if f is not None]
-                query_obj = query_obj.filter(or_(*court_filters))
-                
-            if hearing_date_from:
-                query_obj = query_obj.filter(Cause.hearing_date >= hearing_date_from)
-            if hearing_date_to:
-                query_obj = query_obj.filter(Cause.hearing_date <= hearing_date_to)
-            if case_type:
-                query_obj = query_obj.filter(Cause.case_type.ilike(f"%{case_type}%"))
-            if is_hrce is not None:
-                query_obj = query_obj.filter(Cause.is_hrce == is_hrce)
+            query_obj = apply_text_filters(query_obj, db, query, case_no, petitioner, respondent, advocate, rank)
+            query_obj = apply_filters(query_obj, court_no, hearing_date_from, hearing_date_to, case_type, is_hrce, source)
                 
             causes = query_obj.all()
         
@@ -368,3 +442,40 @@ async def download_causes_pdf(
     except Exception as e:
         print(f"Error generating PDF: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
+
+
+@router.get("/{cause_id}", response_model=CauseResponse)
+async def get_cause(
+    cause_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    cause = db.query(Cause).filter(Cause.id == cause_id).first()
+    if not cause:
+        raise HTTPException(status_code=404, detail="Cause not found")
+    return cause
+
+
+@router.get("/{cause_id}/related", response_model=List[RelatedCase])
+async def get_related_causes(
+    cause_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    cause = db.query(Cause).filter(Cause.id == cause_id).first()
+    if not cause:
+        raise HTTPException(status_code=404, detail="Cause not found")
+    
+    # Edges are computed at ingest time (see related_cases.py)
+    edges = (
+        db.query(RelatedCause, Cause)
+        .join(Cause, Cause.id == RelatedCause.related_id)
+        .filter(RelatedCause.cause_id == cause_id)
+        .order_by(RelatedCause.score.desc(), RelatedCause.related_id.desc())
+        .limit(10)
+        .all()
+    )
+    return [
+        RelatedCase(cause=other_cause, similarity_score=edge.score, match_reason=edge.reason)
+        for edge, other_cause in edges
+    ]
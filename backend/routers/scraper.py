@@ -1,13 +1,18 @@
+import asyncio
+import json
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import date
 
 from database import get_db
-from models import User, UserRole, ScraperLog, Cause
-from schemas import ScraperLogResponse, ScraperTriggerResponse
+from models import User, UserRole, ScraperLog, Cause, ScraperJob
+from schemas import ScraperLogResponse, ScraperTriggerResponse, ScraperJobResponse, ScraperJobResultResponse
 from routers.auth import get_current_user
-from scraper import run_scraper, stop_scraper, get_scraper_progress
+from scraper import stop_scraper, get_scraper_progress
+import jobs
 
 router = APIRouter()
 
@@ -20,6 +25,7 @@ def check_admin_or_superadmin(current_user: User):
 @router.post("/trigger", response_model=ScraperTriggerResponse)
 def trigger_scraper(
     target_date: date = None,
+    force: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -27,19 +33,96 @@ def trigger_scraper(
     
     print(f"Triggering scraper with target_date: {target_date}")
     
-    try:
-        records_count = run_scraper(db, target_date)
-        return ScraperTriggerResponse(
-            message="Scraper completed successfully",
-            status="success",
-            records_extracted=records_count
-        )
-    except Exception as e:
-        return ScraperTriggerResponse(
-            message=f"Scraper failed: {str(e)}",
-            status="error",
-            records_extracted=0
-        )
+    # The scrape runs as a background job; poll /jobs/{job_id} for its outcome
+    job = jobs.submit_job(db, target_date, force, current_user.username)
+    return ScraperTriggerResponse(
+        message=f"Scraper job {job.id} {job.status.value}",
+        status=job.status.value,
+        records_extracted=job.records_extracted or 0,
+        job_id=job.id
+    )
+
+
+@router.post("/backfill", response_model=ScraperTriggerResponse)
+def trigger_backfill(
+    date_from: date,
+    date_to: date,
+    force: bool = False,
+    retry_missing: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin_or_superadmin(current_user)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must not be after date_to")
+
+    # Queued behind any running scrape, stopped by /stop or /jobs/{job_id}/cancel.
+    # Dates finish into checkpoints, so the same range submitted again after
+    # a stop or a crash resumes where it left off.
+    job = jobs.submit_job(
+        db,
+        force=force,
+        requested_by=current_user.username,
+        date_from=date_from,
+        date_to=date_to,
+        retry_missing=retry_missing,
+    )
+    return ScraperTriggerResponse(
+        message=f"Backfill job {job.id} {job.status.value}",
+        status=job.status.value,
+        records_extracted=job.records_extracted or 0,
+        job_id=job.id
+    )
+
+
+def get_job_or_404(db: Session, job_id: int) -> ScraperJob:
+    job = db.query(ScraperJob).filter(ScraperJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Scraper job not found")
+    return job
+
+
+@router.get("/jobs", response_model=List[ScraperJobResponse])
+def list_scraper_jobs(
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin_or_superadmin(current_user)
+    return db.query(ScraperJob).order_by(ScraperJob.id.desc()).limit(limit).all()
+
+
+@router.get("/jobs/{job_id}", response_model=ScraperJobResponse)
+def get_scraper_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin_or_superadmin(current_user)
+    return get_job_or_404(db, job_id)
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=ScraperJobResponse)
+def cancel_scraper_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin_or_superadmin(current_user)
+    return jobs.cancel_job(db, get_job_or_404(db, job_id))
+
+
+@router.get("/jobs/{job_id}/results", response_model=ScraperJobResultResponse)
+def get_scraper_job_results(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin_or_superadmin(current_user)
+    job = get_job_or_404(db, job_id)
+    result = ScraperJobResultResponse.model_validate(job)
+    result.logs = job.log_output.split("\n") if job.log_output else []
+    return result
 
 
 @router.get("/logs", response_model=List[ScraperLogResponse])
@@ -83,11 +166,16 @@ async def get_scraper_status(
 
 
 @router.post("/stop")
-async def stop_scraper_endpoint(
+def stop_scraper_endpoint(
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     check_admin_or_superadmin(current_user)
-    stop_scraper()
+    running_job = jobs.get_running_job(db)
+    if running_job:
+        jobs.cancel_job(db, running_job)
+    else:
+        stop_scraper()
     return {"message": "Scraper stop requested"}
 
 
@@ -97,3 +185,45 @@ async def get_progress(
 ):
     check_admin_or_superadmin(current_user)
     return get_scraper_progress()
+
+
+# How often the stream checks for new progress, and how long it may stay
+# quiet before sending a keep-alive so proxies don't drop the connection
+PROGRESS_POLL_SECONDS = 0.5
+PROGRESS_KEEPALIVE_SECONDS = 15
+
+
+@router.get("/progress/stream")
+async def stream_progress(
+    current_user: User = Depends(get_current_user)
+):
+    check_admin_or_superadmin(current_user)
+
+    async def events():
+        last_sent = None
+        quiet_for = 0.0
+        while True:
+            progress = get_scraper_progress()
+            # Elapsed time and rates move on every read; what counts as a
+            # change is a metrics update, a new log line or a state flip
+            changed = (
+                progress["metrics"]["version"],
+                progress["log_seq"],
+                progress["is_running"],
+                progress["stop_requested"],
+            )
+            if changed != last_sent:
+                yield f"data: {json.dumps(progress, default=str)}\n\n"
+                last_sent = changed
+                quiet_for = 0.0
+            elif quiet_for >= PROGRESS_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                quiet_for = 0.0
+            await asyncio.sleep(PROGRESS_POLL_SECONDS)
+            quiet_for += PROGRESS_POLL_SECONDS
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,122 @@
+from sqlalchemy import inspect, text
+
+from database import engine
+from models import case_no_columns, court_columns, sr_no_columns
+from search_index import ensure_search_indexes
+
+# Tables are created with Base.metadata.create_all, which never changes a
+# table that already exists. Columns and indexes added to existing tables
+# are listed here and applied at startup (and by running this file). Every
+# step checks the live schema first, so running it again is a no-op.
+
+# (table, column, column DDL) -- the DDL must work on SQLite and PostgreSQL
+COLUMNS = [
+    ("causes", "source", "VARCHAR(50) NOT NULL DEFAULT 'madras'"),
+    ("cause_list_manifests", "source", "VARCHAR(50) NOT NULL DEFAULT 'madras'"),
+    ("backfill_checkpoints", "source", "VARCHAR(50) NOT NULL DEFAULT 'madras'"),
+    ("causes", "court_number", "INTEGER"),
+    ("causes", "court_suffix", "VARCHAR(5) NOT NULL DEFAULT ''"),
+    ("causes", "case_no_type", "VARCHAR(30)"),
+    ("causes", "case_no_number", "INTEGER"),
+    ("causes", "case_no_year", "INTEGER"),
+    ("causes", "sr_number", "INTEGER"),
+    ("scraper_jobs", "date_from", "DATE"),
+    ("scraper_jobs", "date_to", "DATE"),
+    ("scraper_jobs", "retry_missing", "BOOLEAN DEFAULT FALSE"),
+]
+
+# (table, index name, columns, unique) -- an existing index with other
+# columns is dropped and recreated
+INDEXES = [
+    ("causes", "ix_causes_source", ["source"], False),
+    ("causes", "ix_causes_search_order", ["hearing_date", "court_number", "court_suffix", "sr_number", "id"], False),
+    ("causes", "ix_causes_court", ["court_number", "court_suffix"], False),
+    ("causes", "ix_causes_case_no_key", ["case_no_type", "case_no_number", "case_no_year", "hearing_date"], False),
+    ("cause_list_manifests", "uq_cause_list_manifests_source_date", ["source", "hearing_date"], True),
+    ("backfill_checkpoints", "uq_backfill_checkpoints_source_date", ["source", "hearing_date"], True),
+]
+
+# Unique indexes that have been narrowed into a composite key above:
+# (table, index name, columns) -- recreated as plain indexes
+DEMOTED_UNIQUE_INDEXES = [
+    ("cause_list_manifests", "ix_cause_list_manifests_hearing_date", ["hearing_date"]),
+    ("backfill_checkpoints", "ix_backfill_checkpoints_hearing_date", ["hearing_date"]),
+]
+
+
+def backfill_derived(conn, column: str, derive) -> int:
+    # Fill the columns derive(value) returns for every distinct value of
+    # causes.column, one UPDATE per value (riding the index on column).
+    # Returns the number of distinct values.
+    values = conn.execute(text(f"SELECT DISTINCT {column} FROM causes WHERE {column} IS NOT NULL")).scalars().all()
+    for i in range(0, len(values), 1000):
+        params = [{**derive(value), "value": value} for value in values[i:i + 1000]]
+        assignments = ", ".join(f"{name} = :{name}" for name in params[0] if name != "value")
+        conn.execute(text(f"UPDATE causes SET {assignments} WHERE {column} = :value"), params)
+    return len(values)
+
+
+# (column that triggers it, source column, derive) -- run once, in the
+# upgrade that adds the first column, after every column is in place
+BACKFILLS = [
+    ("court_number", "court_no", court_columns),
+    ("case_no_number", "case_no", case_no_columns),
+    ("sr_number", "sr_no", sr_no_columns),
+]
+
+
+def upgrade_schema() -> list:
+    """Apply pending column and index upgrades; returns what was done."""
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    applied = []
+    added = set()
+
+    with engine.begin() as conn:
+        for table, column, ddl in COLUMNS:
+            if table not in tables:
+                continue
+            if column not in {c["name"] for c in inspector.get_columns(table)}:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+                applied.append(f"added {table}.{column}")
+                added.add((table, column))
+
+        for trigger, column, derive in BACKFILLS:
+            if ("causes", trigger) in added:
+                applied.append(f"backfilled {derive.__name__} for {backfill_derived(conn, column, derive)} distinct {column}")
+
+        for table, name, columns in DEMOTED_UNIQUE_INDEXES:
+            if table not in tables:
+                continue
+            index = next((i for i in inspector.get_indexes(table) if i["name"] == name), None)
+            if index and index["unique"]:
+                conn.execute(text(f"DROP INDEX {name}"))
+                conn.execute(text(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"))
+                applied.append(f"made {name} non-unique")
+
+        for table, name, columns, unique in INDEXES:
+            if table not in tables:
+                continue
+            existing = {i["name"]: i["column_names"] for i in inspector.get_indexes(table)}
+            existing.update({c["name"]: c["column_names"] for c in inspector.get_unique_constraints(table)})
+            if name in existing and existing[name] != columns:
+                conn.execute(text(f"DROP INDEX {name}"))
+                applied.append(f"dropped {name} ({', '.join(existing[name])})")
+            elif name in existing:
+                continue
+            conn.execute(text(f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {table} ({', '.join(columns)})"))
+            applied.append(f"created {name}")
+
+        if "causes" in tables:
+            applied.extend(ensure_search_indexes(conn))
+
+    return applied
+
+
+if __name__ == "__main__":
+    from database import Base
+    import models  # noqa: F401  (registers the tables with Base)
+
+    Base.metadata.create_all(bind=engine)
+    for step in upgrade_schema() or ["schema is up to date"]:
+        print(f"✓ {step}")
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, EmailStr
 from datetime import date, time, datetime
 from typing import Optional, List
-from models import UserRole, ScraperStatus
+from models import UserRole, ScraperStatus, ScraperJobStatus
 
 
 class UserCreate(BaseModel):
@@ -58,6 +58,7 @@ class CauseBase(BaseModel):
     case_type: Optional[str] = None
     raw_text: Optional[str] = None
     is_hrce: bool = False
+    source: Optional[str] = None
 
 
 class CauseCreate(CauseBase):
@@ -84,17 +85,39 @@ class CauseSearchParams(BaseModel):
     hearing_date_to: Optional[date] = None
     case_type: Optional[str] = None
     is_hrce: Optional[bool] = None
+    source: Optional[str] = None
     fuzzy: bool = False
     limit: int = 50
     offset: int = 0
 
 
+class CausePage(BaseModel):
+    items: List[CauseResponse]
+    # Opaque; pass back as `cursor` for the next page, None on the last one
+    next_cursor: Optional[str] = None
+
+
 class RelatedCase(BaseModel):
     cause: CauseResponse
     similarity_score: float
     match_reason: str
 
 
+class AdvocateResponse(BaseModel):
+    id: int
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
+class AdvocateHearings(BaseModel):
+    advocate: AdvocateResponse
+    hearing_date: date
+    # In court and serial number order
+    causes: List[CauseResponse]
+
+
 class ScraperLogResponse(BaseModel):
     id: int
     status: ScraperStatus
@@ -111,3 +134,28 @@ class ScraperTriggerResponse(BaseModel):
     message: str
     status: str
     records_extracted: int
+    job_id: Optional[int] = None
+
+
+class ScraperJobResponse(BaseModel):
+    id: int
+    status: ScraperJobStatus
+    target_date: Optional[date] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    retry_missing: bool = False
+    force: bool = False
+    requested_by: Optional[str] = None
+    records_extracted: int = 0
+    error_message: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ScraperJobResultResponse(ScraperJobResponse):
+    logs: List[str] = []
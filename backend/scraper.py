@@ -1,22 +1,63 @@
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from sqlalchemy import and_, insert, select, update
 from sqlalchemy.orm import Session
 import re
-import pdfplumber
 import os
 import tempfile
+import hashlib
+import base64
+import random
 import time
+import multiprocessing
+import queue
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
 
-from models import Cause, ScraperLog, ScraperStatus
+import advocates
+import pdf_archive
+import related_cases
+import search_cache
+from pdf_extract import open_extractor
+from sources import DEFAULT_SOURCE, ENABLED_SOURCES, CauseListSource, get_source
+from fuzzy_index import FUZZY_INDEX
+from scraper_metrics import RunMetrics
+from models import BackfillCheckpoint, BackfillStatus, Cause, CauseListManifest, CauseStaging, ScraperLog, ScraperStatus, case_no_columns, court_columns, sr_no_columns
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-BASE_URL = "https://www.mhc.tn.gov.in/judis/clists/clists-madras"
-DATE_API_URL = f"{BASE_URL}/api/getDate.php?toc=1"
-PDF_BASE_URL = f"{BASE_URL}/causelists/pdf"
+
+# Worker processes used to parse a single PDF (1 = parse in-process)
+PARSE_WORKERS = int(os.getenv("SCRAPER_PARSE_WORKERS", "1"))
+# Pages handed to a worker at a time when parsing in parallel
+PARSE_CHUNK_PAGES = int(os.getenv("SCRAPER_PARSE_CHUNK_PAGES", "25"))
+# Dates downloaded concurrently over the shared HTTP session. This is the
+# global cap: every source's downloads share the one pool.
+DOWNLOAD_WORKERS = int(os.getenv("SCRAPER_DOWNLOAD_WORKERS", "4"))
+# Causes per parse batch and per bulk write when a date is applied
+WRITE_BATCH_SIZE = int(os.getenv("SCRAPER_WRITE_BATCH_SIZE", "500"))
+# Batches buffered between the parse and write stages before parsing waits
+PIPELINE_DEPTH = int(os.getenv("SCRAPER_PIPELINE_DEPTH", "4"))
+# Retries per PDF after the first attempt, and the backoff between them:
+# a random delay up to BACKOFF * 2^attempt seconds, capped at BACKOFF_MAX
+DOWNLOAD_RETRIES = int(os.getenv("SCRAPER_DOWNLOAD_RETRIES", "4"))
+DOWNLOAD_BACKOFF_SECONDS = float(os.getenv("SCRAPER_DOWNLOAD_BACKOFF_SECONDS", "1"))
+DOWNLOAD_BACKOFF_MAX_SECONDS = float(os.getenv("SCRAPER_DOWNLOAD_BACKOFF_MAX_SECONDS", "30"))
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# Cap on PDF requests per second across download threads (0 = no cap)
+REQUESTS_PER_SECOND = float(os.getenv("SCRAPER_REQUESTS_PER_SECOND", "0"))
+# Backfills walk months of dates, so they default to fewer workers and a rate cap
+BACKFILL_WORKERS = int(os.getenv("SCRAPER_BACKFILL_WORKERS", "2"))
+BACKFILL_REQUESTS_PER_SECOND = float(os.getenv("SCRAPER_BACKFILL_REQUESTS_PER_SECOND", "1"))
+# Lines of a run's log kept as its job's log_output (0 = no cap). Past the
+# cap the oldest lines go, but the run's first error line is always kept.
+JOB_LOG_MAX_LINES = int(os.getenv("SCRAPER_JOB_LOG_MAX_LINES", "10000"))
 
 HRCE_KEYWORDS = [
     "HRCE",
@@ -32,23 +73,62 @@ HRCE_KEYWORDS = [
 ]
 
 
+def compile_hrce_pattern(keywords):
+    # All keywords as one alternation, matched against upper-cased text,
+    # so a cause is classified in a single scan instead of one per keyword
+    return re.compile("|".join(re.escape(keyword.upper()) for keyword in keywords))
+
+
+hrce_pattern = compile_hrce_pattern(HRCE_KEYWORDS)
+
+
 # Global state for scraper control
 SCRAPER_STATE = {
     "is_running": False,
     "stop_requested": False,
     "current_action": "Idle",
-    "logs": []
+    "logs": [],
+    # Lines logged since startup; tells the progress stream the logs moved
+    "log_seq": 0,
 }
+# add_log is called from download, parse and writer threads at once
+_state_lock = threading.Lock()
+# Counters and stage timings for the current run
+RUN_METRICS = RunMetrics()
+# The current run's whole log, in run order (SCRAPER_STATE["logs"] only
+# holds the last 50, newest first, for the progress view)
+_run_log = {"lines": deque(), "dropped": 0, "first_error": None}
+error_line_pattern = re.compile(r"\b(error|failed|critical)\b", re.IGNORECASE)
 
 def add_log(message: str):
     timestamp = datetime.now().strftime("%H:%M:%S")
     log_entry = f"[{timestamp}] {message}"
     print(log_entry)
-    SCRAPER_STATE["logs"].insert(0, log_entry)
-    # Keep only last 50 logs
-    if len(SCRAPER_STATE["logs"]) > 50:
-        SCRAPER_STATE["logs"].pop()
-    SCRAPER_STATE["current_action"] = message
+    with _state_lock:
+        SCRAPER_STATE["logs"].insert(0, log_entry)
+        # Keep only last 50 logs
+        if len(SCRAPER_STATE["logs"]) > 50:
+            SCRAPER_STATE["logs"].pop()
+        SCRAPER_STATE["current_action"] = message
+        SCRAPER_STATE["log_seq"] += 1
+        _run_log["lines"].append(log_entry)
+        if _run_log["first_error"] is None and error_line_pattern.search(message):
+            _run_log["first_error"] = log_entry
+        if JOB_LOG_MAX_LINES and len(_run_log["lines"]) > JOB_LOG_MAX_LINES:
+            _run_log["lines"].popleft()
+            _run_log["dropped"] += 1
+
+def get_run_log() -> str:
+    # The current (or last) run's log as stored on its job
+    with _state_lock:
+        lines = list(_run_log["lines"])
+        dropped, first_error = _run_log["dropped"], _run_log["first_error"]
+    if dropped:
+        header = [f"[{dropped} earlier lines dropped, SCRAPER_JOB_LOG_MAX_LINES={JOB_LOG_MAX_LINES}]"]
+        if first_error and first_error not in lines:
+            header.insert(0, first_error)
+        lines = header + lines
+    return "\n".join(lines)
 
 def stop_scraper():
     if SCRAPER_STATE["is_running"]:
@@ -58,20 +138,103 @@ def stop_scraper():
     return False
 
 def get_scraper_progress():
-    return SCRAPER_STATE
+    # Consistent copy for API responses; the live state keeps changing underneath
+    with _state_lock:
+        progress = {**SCRAPER_STATE, "logs": list(SCRAPER_STATE["logs"])}
+    progress["metrics"] = RUN_METRICS.snapshot()
+    return progress
+
+_http_session = None
+_http_pool_size = 0
+_http_session_lock = threading.Lock()
+
+def get_http_session(workers: int | None = None) -> requests.Session:
+    # One keep-alive session for all court requests so downloads reuse
+    # TCP/TLS connections instead of paying the handshake per PDF. The pool
+    # holds a connection per download thread; a run with more threads than
+    # it (workers) grows it, or urllib3 would discard the extra connections
+    # and keep-alive would be lost.
+    global _http_session, _http_pool_size
+    size = max(workers or 0, DOWNLOAD_WORKERS, BACKFILL_WORKERS, 1)
+    with _http_session_lock:
+        if _http_session is None:
+            _http_session = requests.Session()
+            _http_session.verify = False
+        if size > _http_pool_size:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            _http_session.mount("https://", adapter)
+            _http_session.mount("http://", adapter)
+            _http_pool_size = size
+        return _http_session
+
+class RequestThrottle:
+    # Spaces request starts at least 1/requests_per_second apart, shared by
+    # all download threads, so concurrency doesn't turn into a burst
+    def __init__(self, requests_per_second: float | None = None):
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+    
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
 
 def detect_hrce_case(text: str) -> bool:
     if not text:
         return False
-    text_upper = text.upper()
-    return any(keyword.upper() in text_upper for keyword in HRCE_KEYWORDS)
+    return hrce_pattern.search(text.upper()) is not None
+
+def is_hrce_cause(*texts) -> bool:
+    # Newline never occurs in a keyword, so joining can't create false matches
+    return detect_hrce_case("\n".join(text for text in texts if text))
+
+def reclassify_hrce(db: Session, chunk_size: int = 1000) -> int:
+    # Re-evaluate Cause.is_hrce for the whole table after HRCE_KEYWORDS
+    # changes, walking it in id order one chunk per transaction.
+    # Returns the number of rows whose flag changed.
+    changed = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Cause.id, Cause.source, Cause.hearing_date, Cause.petitioner, Cause.respondent, Cause.raw_text, Cause.is_hrce)
+            .filter(Cause.id > last_id)
+            .order_by(Cause.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not rows:
+            break
+        
+        updates = []
+        segments = set()
+        for row in rows:
+            is_hrce = is_hrce_cause(row.petitioner, row.respondent, row.raw_text)
+            if is_hrce != bool(row.is_hrce):
+                updates.append({"id": row.id, "is_hrce": is_hrce})
+                segments.add((row.source, row.hearing_date))
+        if updates:
+            db.bulk_update_mappings(Cause, updates)
+            search_cache.bump_generation(db, segments)
+            db.commit()
+        
+        changed += len(updates)
+        last_id = rows[-1].id
+    
+    return changed
 
-def fetch_available_dates():
+def fetch_available_dates(source: CauseListSource | None = None):
+    source = source or get_source(DEFAULT_SOURCE)
     max_retries = 2
     for attempt in range(max_retries):
         try:
-            add_log(f"Fetching dates (attempt {attempt + 1}/{max_retries})...")
-            response = requests.get(DATE_API_URL, verify=False, timeout=30)
+            add_log(f"Fetching {source.name} dates (attempt {attempt + 1}/{max_retries})...")
+            response = get_http_session().get(source.date_api_url(), timeout=30)
             response.raise_for_status()
             data = response.json()
             # data is list of dicts: [{"doc":"2025-11-24"}, ...]
@@ -87,264 +250,958 @@ def fetch_available_dates():
     
     return []
 
-def download_pdf(date_str):
-    # date_str is YYYY-MM-DD
-    # PDF filename format: cause_DDMMYYYY.pdf
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
-    filename = f"cause_{dt.strftime('%d%m%Y')}.pdf"
-    url = f"{PDF_BASE_URL}/{filename}"
+def backoff_delay(attempt: int) -> float:
+    # Exponential backoff with full jitter, so parallel downloads that failed
+    # together don't all retry at the same instant
+    return random.uniform(0, min(DOWNLOAD_BACKOFF_MAX_SECONDS, DOWNLOAD_BACKOFF_SECONDS * 2 ** attempt))
+
+
+def wait_before_retry(attempt: int) -> bool:
+    # Sleeps off the backoff in short steps; False if a stop came in meanwhile
+    deadline = time.monotonic() + backoff_delay(attempt)
+    while time.monotonic() < deadline:
+        if SCRAPER_STATE["stop_requested"]:
+            return False
+        time.sleep(min(0.5, max(deadline - time.monotonic(), 0)))
+    return not SCRAPER_STATE["stop_requested"]
+
+
+def expected_digest(headers) -> tuple | None:
+    # (algorithm, base64 digest) from a Digest (RFC 3230) or Content-MD5 header,
+    # when the server sends one
+    for part in headers.get("Digest", "").split(","):
+        algorithm, _, value = part.strip().partition("=")
+        if algorithm.lower() in ("sha-256", "md5") and value:
+            return algorithm.lower().replace("-", ""), value
+    if headers.get("Content-MD5"):
+        return "md5", headers["Content-MD5"]
+    return None
+
+
+def verify_pdf_file(path: str, expected_length: int | None, digest: tuple | None) -> str | None:
+    # Returns why the file is not a complete download, or None if it is
+    size = os.path.getsize(path)
+    if expected_length is not None and size != expected_length:
+        return f"expected {expected_length} bytes, got {size}"
+    with open(path, "rb") as f:
+        if f.read(5) != b"%PDF-":
+            return "not a PDF"
+        f.seek(max(size - 1024, 0))
+        if b"%%EOF" not in f.read():
+            return "PDF trailer missing"
+    if digest:
+        algorithm, value = digest
+        file_digest = hashlib.new(algorithm)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                file_digest.update(chunk)
+        if base64.b64encode(file_digest.digest()).decode() != value:
+            return f"{algorithm} digest mismatch"
+    return None
+
+
+def download_pdf(
+    date_str,
+    manifest: dict | None = None,
+    throttle: RequestThrottle | None = None,
+    source: CauseListSource | None = None,
+):
+    # date_str is YYYY-MM-DD; the PDF URL comes from the source's template
+    # Returns None on failure, otherwise a dict describing the download.
+    # When a manifest from a previous run is given, the request is made
+    # conditional and a 304 comes back as {"not_modified": True, ...}.
+    # A 404 (no list published that day) comes back as {"missing": True, ...}.
+    #
+    # Timeouts, dropped connections and 5xx/429 responses are retried with
+    # backoff. Bytes already received are kept and the next attempt asks for
+    # the rest with a Range request (guarded by If-Range, so a file that
+    # changed in between is fetched whole). The finished file is checked
+    # for length, PDF structure and any digest the server advertises.
+    source = source or get_source(DEFAULT_SOURCE)
+    url = source.pdf_url(datetime.strptime(date_str, "%Y-%m-%d"))
+    # Only used in log messages
+    filename = f"{source.name}/{url.rpartition('/')[2]}"
     
-    max_retries = 2
+    conditional_headers = {}
+    if manifest and manifest.get("url") == url:
+        if manifest.get("etag"):
+            conditional_headers["If-None-Match"] = manifest["etag"]
+        if manifest.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = manifest["last_modified"]
     
-    for attempt in range(max_retries):
-        try:
-            add_log(f"Downloading {filename} (attempt {attempt + 1}/{max_retries})...")
+    path = None
+    received = 0
+    digest = None
+    response_headers = {}
+    expected_length = None
+    
+    try:
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            if attempt and not wait_before_retry(attempt - 1):
+                add_log(f"Download of {filename} abandoned: scraper stopping")
+                return None
+            if throttle:
+                throttle.wait()
             
-            response = requests.get(url, verify=False, timeout=30, stream=True)
-            if response.status_code == 200:
-                fd, path = tempfile.mkstemp(suffix=".pdf")
-                with os.fdopen(fd, 'wb') as tmp:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        tmp.write(chunk)
-                
-                file_size = os.path.getsize(path)
-                add_log(f"Downloaded successfully ({file_size} bytes)")
-                return path
+            if received:
+                validator = response_headers.get("ETag") or response_headers.get("Last-Modified")
+                headers = {"Range": f"bytes={received}-"}
+                if validator:
+                    headers["If-Range"] = validator
+                add_log(f"Resuming {filename} from byte {received} (attempt {attempt + 1}/{DOWNLOAD_RETRIES + 1})...")
             else:
-                add_log(f"HTTP error: {response.status_code}. Giving up.")
-                return None
-        except requests.exceptions.Timeout:
-            add_log(f"Download timeout on attempt {attempt + 1}. Giving up.")
-            return None
-        except requests.exceptions.ConnectionError as e:
-            add_log(f"Connection error: {str(e)[:80]}")
-            return None
-        except Exception as e:
-            add_log(f"Error downloading PDF: {str(e)[:100]}")
-            return None
+                headers = conditional_headers
+                add_log(f"Downloading {filename} (attempt {attempt + 1}/{DOWNLOAD_RETRIES + 1})...")
+            
+            try:
+                with RUN_METRICS.timed("download"):
+                    response = get_http_session().get(url, headers=headers, timeout=30, stream=True)
+                    if response.status_code == 304:
+                        add_log(f"{filename} not modified since last run")
+                        return {"url": url, "path": None, "not_modified": True}
+                    if response.status_code == 404:
+                        add_log(f"No cause list published at {filename}")
+                        return {"url": url, "path": None, "not_modified": False, "missing": True}
+                    if response.status_code in RETRYABLE_STATUSES:
+                        add_log(f"HTTP error {response.status_code} for {filename}, will retry")
+                        response.close()
+                        continue
+                    if response.status_code not in (200, 206):
+                        add_log(f"HTTP error: {response.status_code}. Giving up.")
+                        return None
+                    
+                    if response.status_code == 206 and received:
+                        # Content-Range: bytes <start>-<end>/<total>
+                        content_range = response.headers.get("Content-Range", "")
+                        if not content_range.startswith(f"bytes {received}-"):
+                            add_log(f"Unexpected Content-Range '{content_range}' for {filename}, restarting")
+                            received = 0
+                            continue
+                        total = content_range.rpartition("/")[2]
+                        expected_length = int(total) if total.isdigit() else None
+                        mode = "ab"
+                    else:
+                        # Fresh download, or the file changed and the server sent it whole
+                        if path is None:
+                            fd, path = tempfile.mkstemp(suffix=".pdf")
+                            os.close(fd)
+                        received = 0
+                        digest = hashlib.sha256()
+                        response_headers = response.headers
+                        content_length = response.headers.get("Content-Length")
+                        # Content-Length counts encoded bytes; iter_content yields decoded ones
+                        encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+                        expected_length = int(content_length) if content_length and content_length.isdigit() and not encoded else None
+                        mode = "wb"
+                    
+                    with open(path, mode) as tmp:
+                        for chunk in response.iter_content(chunk_size=8192):
+                            tmp.write(chunk)
+                            digest.update(chunk)
+                            received += len(chunk)
+                            RUN_METRICS.incr("bytes_downloaded", len(chunk))
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                add_log(f"Download of {filename} interrupted after {received} bytes: {str(e)[:80]}")
+                continue
+            
+            problem = verify_pdf_file(path, expected_length, expected_digest(response_headers))
+            if problem:
+                add_log(f"Incomplete download of {filename} ({problem}), will retry")
+                if expected_length is None or received >= expected_length:
+                    # Resuming can't fix a complete-looking but bad file
+                    received = 0
+                continue
+            
+            add_log(f"Downloaded successfully ({received} bytes)")
+            result = {
+                "url": url,
+                "path": path,
+                "not_modified": False,
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "content_length": received,
+                "content_hash": digest.hexdigest(),
+            }
+            path = None
+            return result
+        
+        add_log(f"Failed to download {filename} after {DOWNLOAD_RETRIES + 1} attempts")
+        return None
+    except Exception as e:
+        add_log(f"Error downloading PDF: {str(e)[:100]}")
+        return None
+    finally:
+        # Only a successful download hands its file to the caller
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+def iter_downloads(items, manifests: dict | None = None, workers: int | None = None, throttle: RequestThrottle | None = None):
+    # items are (source_name, date_str) pairs. Downloads run concurrently
+    # and (source_name, date_str, download) is yielded as each one lands,
+    # so parsing starts without waiting for the rest. At most workers * 2
+    # are in flight or waiting to be consumed: the next download starts
+    # only when the consumer comes back for another, so a slow parser
+    # doesn't leave a pile of temp PDFs on disk.
+    manifests = manifests or {}
+    workers = max(workers or DOWNLOAD_WORKERS, 1)
+    # Size the connection pool for these threads before they start
+    get_http_session(workers)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-download")
+    items = iter(items)
+    pending = {}
     
-    add_log(f"Failed to download {filename}")
-    return None
+    def submit_next() -> bool:
+        item = next(items, None)
+        if item is None:
+            return False
+        source_name, date_str = item
+        future = executor.submit(download_pdf, date_str, manifests.get((source_name, date_str)), throttle, get_source(source_name))
+        pending[future] = item
+        return True
+    
+    try:
+        while len(pending) < workers * 2 and submit_next():
+            pass
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                source_name, date_str = pending.pop(future)
+                yield source_name, date_str, future.result()
+                submit_next()
+    finally:
+        # If the consumer stopped early, drop queued downloads and clean up
+        # files that finished but were never handed out
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future in pending:
+            if not future.cancelled() and future.result() and future.result()["path"]:
+                os.remove(future.result()["path"])
+
+
+# Regex patterns
+CASE_NO_PATTERN = r"[A-Z]+(?:[/ ][A-Za-z0-9]+)?[/ ]\d+/\d+"
+court_pattern = re.compile(r"COURT\s+NO\.\s+(\d+\s*[a-zA-Z]?)")
+# Every line is matched once against a single pattern with three branches:
+#   SrNo CaseNo Rest       -> main case
+#   (AND)? CaseNo Rest     -> connected case under the current Sr No
+#   AND                    -> connected case whose number is on the next line
+line_pattern = re.compile(
+    rf"^(?:(?P<sr_no>\d+)\s+(?P<main_case>{CASE_NO_PATTERN})\s+(?P<main_rest>.*)"
+    rf"|\s*(?:AND)?\s*(?P<connected_case>{CASE_NO_PATTERN})\s+(?P<connected_rest>.*)"
+    r"|\s*AND\s*$)"
+)
+# Case number at the start of the line following a bare "AND"
+bare_case_pattern = re.compile(rf"^\s*({CASE_NO_PATTERN})\s+(.*)")
+advocate_prefix_pattern = re.compile(r'\s+(M/S\.|Mr\.|Ms\.|Mrs\.|Dr\.|Adv\.)')
+column_gap_pattern = re.compile(r'\s{2,}')
+case_type_pattern = re.compile(r"\((.*?)\)")
+vs_pattern = re.compile(r'VS|vs', re.IGNORECASE)
+leading_dashes_pattern = re.compile(r'^-+\s*')
+
+# Line kinds produced by classify_lines
+LINE_OTHER = 0
+LINE_MAIN = 1
+LINE_CONNECTED = 2
+LINE_AND = 3
+
+
+def classify_lines(lines):
+    # One pass over the page text. Each line becomes (text, kind, match, court):
+    # the stripped text, its LINE_* kind, the line_pattern match and the
+    # COURT NO. header it carries, if any.
+    tokens = []
+    for line in lines:
+        text = line.strip()
+        match = line_pattern.match(text) if text else None
+        if match is None:
+            kind = LINE_OTHER
+        elif match.group("main_case"):
+            kind = LINE_MAIN
+        elif match.group("connected_case"):
+            kind = LINE_CONNECTED
+        else:
+            kind = LINE_AND
+        
+        court = None
+        if "COURT" in line:
+            # Searched on the unstripped line to keep the header text as printed
+            court_match = court_pattern.search(line)
+            if court_match:
+                court = f"COURT NO. {court_match.group(1)}"
+        tokens.append((text, kind, match, court))
+    return tokens
+
+
+def split_petitioner_advocate(rest_of_line):
+    # Look for common advocate prefixes
+    adv_split = advocate_prefix_pattern.split(rest_of_line, 1)
+    if len(adv_split) >= 3:
+        return adv_split[0].strip(), (adv_split[1] + adv_split[2]).strip()
+    
+    # Fallback to double space split
+    parts = column_gap_pattern.split(rest_of_line, 2)
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+def scan_case_details(tokens, i):
+    # Look ahead up to five lines for the case type and respondent.
+    # The structure is usually:
+    # Line 1: Seq CaseNo Petitioner Advocate
+    # Line 2: (CaseType) VS
+    # Line 3: Respondent Location
+    case_type = ""
+    respondent = ""
+    found_vs = False
+    
+    for text, kind, _, _ in tokens[i + 1:i + 6]:
+        # Stop before the next case's line
+        if kind != LINE_OTHER:
+            break
+        
+        if not case_type and "(" in text:
+            case_type_match = case_type_pattern.search(text)
+            if case_type_match:
+                case_type = case_type_match.group(1)
+        
+        if "vs" in text.lower():
+            found_vs = True
+            # If there is text after VS, it is likely the respondent
+            vs_parts = vs_pattern.split(text, 2)
+            if len(vs_parts) > 1 and len(vs_parts[1].strip()) > 3:
+                respondent = leading_dashes_pattern.sub('', vs_parts[1].strip())
+        elif found_vs and not respondent:
+            # Otherwise the respondent is on the line after VS
+            respondent = text.split('   ')[0].strip()
+            break
+    
+    return case_type, respondent
+
 
-def parse_pdf_content(pdf_path, hearing_date):
+def parse_page(lines, hearing_date):
+    # Walks the classified lines once, tracking the court header by position.
+    # Returns (page_court, causes): the last COURT NO. header on the page,
+    # which carries over to following pages, and the causes found. Causes
+    # above the page's first header get court_no None and inherit the
+    # previous page's court when pages are merged back in order.
+    tokens = classify_lines(lines)
     causes = []
     current_court = None
+    current_sr_no = None
+    i = 0
     
-    # Regex patterns
-    court_pattern = re.compile(r"COURT\s+NO\.\s+(\d+\s*[a-zA-Z]?)")
-    # Main case pattern: SrNo CaseNo Rest
-    main_case_pattern = re.compile(r"^(\d+)\s+([A-Z]+(?:[/ ][A-Za-z0-9]+)?[/ ]\d+/\d+)\s+(.*)")
-    # Connected case pattern: (AND)? CaseNo Rest
-    # Matches lines starting with AND or just whitespace, then a case number
-    connected_case_pattern = re.compile(r"^\s*(?:AND)?\s*([A-Z]+(?:[/ ][A-Za-z0-9]+)?[/ ]\d+/\d+)\s+(.*)")
-    # Pattern for just "AND" on a line, implying next line has case info
-    and_only_pattern = re.compile(r"^\s*AND\s*$")
+    while i < len(tokens):
+        text, kind, match, court = tokens[i]
+        if court:
+            current_court = court
+        
+        if kind == LINE_MAIN:
+            current_sr_no = match.group("sr_no")
+            case_no = match.group("main_case")
+            rest_of_line = match.group("main_rest")
+        elif kind == LINE_CONNECTED and current_sr_no:
+            case_no = match.group("connected_case")
+            rest_of_line = match.group("connected_rest")
+        elif kind == LINE_AND and current_sr_no:
+            # "AND" is on this line, the case number should start the next one
+            next_match = bare_case_pattern.match(tokens[i + 1][0]) if i + 1 < len(tokens) else None
+            i += 1
+            if not next_match:
+                continue
+            case_no, rest_of_line = next_match.groups()
+            if tokens[i][3]:
+                current_court = tokens[i][3]
+        else:
+            i += 1
+            continue
+        
+        petitioner, advocate = split_petitioner_advocate(rest_of_line)
+        case_type, respondent = scan_case_details(tokens, i)
+        
+        causes.append({
+            "sr_no": current_sr_no,
+            "court_no": current_court,
+            "case_no": case_no,
+            "petitioner": petitioner,
+            "respondent": respondent,
+            "advocate": advocate,
+            "hearing_date": hearing_date,
+            "case_type": case_type,
+            "raw_text": text,
+            "is_hrce": is_hrce_cause(petitioner, respondent, text)
+        })
+        i += 1
     
+    return current_court, causes
+
+
+# Page parsers by profile name, as named by CauseListSource.parser. A bench
+# whose lists are laid out differently adds its own parse_page here.
+PARSER_PROFILES = {
+    "mhc": parse_page,
+}
+
+
+# End of iter_page_texts; None can't mark it, extractors return None for
+# a page without text
+_END = object()
+
+
+def iter_page_results(extractor, hearing_date, start=0, end=None, profile="mhc"):
+    # Yields (page_court, causes, extract_seconds, parse_seconds) for each
+    # page in [start, end). Timings travel with the results because worker
+    # processes can't update this process's RUN_METRICS.
+    parse = PARSER_PROFILES[profile]
+    texts = extractor.iter_page_texts(start, end)
+    while True:
+        started = time.perf_counter()
+        text = next(texts, _END)
+        extracted = time.perf_counter()
+        if text is _END:
+            return
+        if not text:
+            # Empty page: nothing to parse, but it still counts as read
+            yield None, [], extracted - started, 0.0
+            continue
+        page_court, causes = parse(text.split('\n'), hearing_date)
+        yield page_court, causes, extracted - started, time.perf_counter() - extracted
+
+
+def parse_page_range(pdf_path, hearing_date, start, end, backend, profile):
+    # Worker entry point: open documents can't be pickled, so each
+    # worker process opens the PDF itself and only returns plain dicts.
+    with open_extractor(pdf_path, backend) as extractor:
+        return list(iter_page_results(extractor, hearing_date, start, end, profile))
+
+
+def parse_pool(workers: int | None = None) -> ProcessPoolExecutor | None:
+    # Worker processes for parsing, started once per run and shared by its
+    # PDFs (None when parsing in-process). Not forked: the pool is started
+    # while download threads are running, and a child forked from a
+    # multithreaded process can deadlock on a lock held at fork time.
+    workers = workers or PARSE_WORKERS
+    if workers <= 1:
+        return None
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+def iter_parallel_page_results(pdf_path, hearing_date, page_count, workers, backend, profile, pool=None):
+    # pool is the run's parse_pool; without one a pool is started for this PDF
+    executor = pool or parse_pool(workers)
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if not text:
-                    continue
-                    
-                lines = text.split('\n')
-                
-                # Try to find court number
-                for line in lines:
-                    match = court_pattern.search(line)
-                    if match:
-                        current_court = f"COURT NO. {match.group(1)}"
-                
-                i = 0
-                current_sr_no = None
-                
-                while i < len(lines):
-                    line = lines[i].strip()
-                    if not line:
-                        i += 1
-                        continue
+        # Keep only a couple of chunks per worker in flight so a slow
+        # consumer doesn't let finished chunks pile up in memory
+        in_flight = deque()
+        for start in range(0, page_count, PARSE_CHUNK_PAGES):
+            end = min(start + PARSE_CHUNK_PAGES, page_count)
+            in_flight.append(executor.submit(parse_page_range, pdf_path, hearing_date, start, end, backend, profile))
+            if len(in_flight) >= workers * 2:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+    finally:
+        if executor is not pool:
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            # Chunks of a PDF given up on mustn't hold up the next one
+            for future in in_flight:
+                future.cancel()
 
-                    # Check for Main Case
-                    main_match = main_case_pattern.match(line)
-                    connected_match = connected_case_pattern.match(line)
-                    and_only_match = and_only_pattern.match(line)
-                    
-                    is_main = bool(main_match)
-                    is_connected = bool(connected_match) and not is_main
-                    is_and_only = bool(and_only_match)
-                    
-                    if is_main and main_match:
-                        current_sr_no = main_match.group(1)
-                        case_no = main_match.group(2)
-                        rest_of_line = main_match.group(3)
-                    elif is_connected and current_sr_no and connected_match:
-                        # It's a connected case under the current Sr No
-                        case_no = connected_match.group(1)
-                        rest_of_line = connected_match.group(2)
-                    elif is_and_only and current_sr_no:
-                        # "AND" is on this line, check next line for case no
-                        if i + 1 < len(lines):
-                            next_line = lines[i+1].strip()
-                            # Try to match case pattern on next line
-                            # It might not have "AND" prefix since "AND" was on previous line
-                            # But we can reuse connected_case_pattern or just look for case no
-                            next_match = re.match(r"^\s*([A-Z]+(?:[/ ][A-Za-z0-9]+)?[/ ]\d+/\d+)\s+(.*)", next_line)
-                            if next_match:
-                                case_no = next_match.group(1)
-                                rest_of_line = next_match.group(2)
-                                i += 1 # Skip the next line since we consumed it
-                            else:
-                                i += 1
-                                continue
-                        else:
-                            i += 1
-                            continue
-                    else:
-                        # Not a case line, move on
-                        i += 1
-                        continue
-                        
-                    # Common parsing logic for both main and connected cases
-                    # Improved Petitioner/Advocate separation
-                    # Look for common advocate prefixes
-                    adv_split = re.split(r'\s+(M/S\.|Mr\.|Ms\.|Mrs\.|Dr\.|Adv\.)', rest_of_line, 1)
-                    
-                    if len(adv_split) >= 3:
-                        petitioner = adv_split[0].strip()
-                        advocate = (adv_split[1] + adv_split[2]).strip()
-                    else:
-                        # Fallback to double space split
-                        parts = re.split(r'\s{2,}', rest_of_line)
-                        petitioner = parts[0] if len(parts) > 0 else ""
-                        advocate = parts[1] if len(parts) > 1 else ""
-                    
-                    case_type = ""
-                    respondent = ""
-                    
-                    # Look ahead for next lines to find VS and Respondent
-                    # The structure is usually:
-                    # Line 1: Seq CaseNo Petitioner Advocate
-                    # Line 2: (CaseType) VS
-                    # Line 3: Respondent Location
-                    
-                    # Check next few lines
-                    j = 1
-                    found_vs = False
-                    
-                    # We need to be careful not to consume the next case's line
-                    while i + j < len(lines) and j <= 5: # Increased lookahead slightly
-                        next_line = lines[i+j].strip()
-                        
-                        # Stop if next line looks like a new case
-                        if main_case_pattern.match(next_line) or connected_case_pattern.match(next_line) or and_only_pattern.match(next_line):
-                            break
-                        
-                        # Check for Case Type
-                        if not case_type and "(" in next_line:
-                                case_type_match = re.search(r"\((.*?)\)", next_line)
-                                if case_type_match:
-                                    case_type = case_type_match.group(1)
-                        
-                        # Check for VS
-                        if "VS" in next_line or "vs" in next_line.lower():
-                            found_vs = True
-                            # Sometimes VS is on the same line as Respondent
-                            # or Respondent is on the next line
-                            
-                            # If there is text after VS, it might be respondent
-                            vs_parts = re.split(r'VS|vs', next_line, flags=re.IGNORECASE)
-                            if len(vs_parts) > 1 and len(vs_parts[1].strip()) > 3:
-                                    # Likely respondent is here
-                                    respondent = vs_parts[1].strip()
-                                    # Clean up dashes
-                                    respondent = re.sub(r'^-+\s*', '', respondent)
-                            
-                        elif found_vs and not respondent:
-                            # This line is likely the respondent
-                            respondent = next_line.split('   ')[0].strip()
-                            # Don't break immediately, might find more info or clean up
-                            break
-                        
-                        j += 1
-                        
-                    cause_data = {
-                        "sr_no": current_sr_no,
-                        "court_no": current_court,
-                        "case_no": case_no,
-                        "petitioner": petitioner,
-                        "respondent": respondent,
-                        "advocate": advocate,
-                        "hearing_date": hearing_date,
-                        "case_type": case_type,
-                        "raw_text": line,
-                        "is_hrce": detect_hrce_case(petitioner) or detect_hrce_case(respondent) or detect_hrce_case(line)
-                    }
-                    causes.append(cause_data)
-                    i += 1
-                    
+
+def iter_pdf_causes(
+    pdf_path,
+    hearing_date,
+    workers: int | None = None,
+    backend: str | None = None,
+    profile: str = "mhc",
+    pool: ProcessPoolExecutor | None = None,
+):
+    # Yields cause dicts page by page, in document order. Errors propagate
+    # so ingestion can roll back instead of treating a partial list as whole.
+    # backend picks the text extractor (see pdf_extract.EXTRACTORS), profile
+    # the page parser (see PARSER_PROFILES). pool is a parse_pool(workers)
+    # to reuse across PDFs.
+    current_court = None
+    workers = workers or PARSE_WORKERS
+    
+    with open_extractor(pdf_path, backend) as extractor:
+        page_count = extractor.page_count()
+        if workers > 1 and page_count > PARSE_CHUNK_PAGES:
+            page_results = iter_parallel_page_results(pdf_path, hearing_date, page_count, workers, extractor.name, profile, pool)
+        else:
+            page_results = iter_page_results(extractor, hearing_date, profile=profile)
+        
+        # Merge pages in order, carrying the court header across pages
+        for page_court, page_causes, extract_seconds, parse_seconds in page_results:
+            RUN_METRICS.add_time("extract", extract_seconds)
+            RUN_METRICS.add_time("parse", parse_seconds)
+            RUN_METRICS.incr("pages_parsed")
+            for cause_data in page_causes:
+                if cause_data["court_no"] is None:
+                    cause_data["court_no"] = current_court
+                yield cause_data
+            if page_court:
+                current_court = page_court
+
+
+def parse_pdf_content(pdf_path, hearing_date, workers: int | None = None, backend: str | None = None):
+    causes = []
+    try:
+        for cause_data in iter_pdf_causes(pdf_path, hearing_date, workers, backend):
+            causes.append(cause_data)
     except Exception as e:
         print(f"Error parsing PDF: {e}")
-        
     return causes
 
-def scrape_cause_list(db: Session, target_date: date | None = None) -> int:
-    SCRAPER_STATE["is_running"] = True
-    SCRAPER_STATE["stop_requested"] = False
-    SCRAPER_STATE["logs"] = []
-    total_extracted = 0
+
+def iter_batches(items, size):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def load_manifests(db: Session, items) -> dict:
+    # Plain-dict snapshot of stored manifests, safe to hand to download
+    # threads, keyed like items by (source_name, date_str)
+    hearing_dates = {datetime.strptime(d, "%Y-%m-%d").date() for _, d in items}
+    source_names = {source_name for source_name, _ in items}
+    rows = (
+        db.query(CauseListManifest)
+        .filter(CauseListManifest.hearing_date.in_(hearing_dates), CauseListManifest.source.in_(source_names))
+        .all()
+    )
+    return {
+        (row.source, row.hearing_date.strftime("%Y-%m-%d")): {
+            "url": row.url,
+            "etag": row.etag,
+            "last_modified": row.last_modified,
+            "content_hash": row.content_hash,
+        }
+        for row in rows
+    }
+
+
+def record_manifest(db: Session, source_name: str, hearing_date: date, download: dict, causes_count: int):
+    # Caller commits, so the manifest lands in the same transaction as the causes
+    manifest = (
+        db.query(CauseListManifest)
+        .filter(CauseListManifest.source == source_name, CauseListManifest.hearing_date == hearing_date)
+        .first()
+    )
+    if not manifest:
+        manifest = CauseListManifest(source=source_name, hearing_date=hearing_date)
+        db.add(manifest)
+    manifest.url = download["url"]
+    manifest.etag = download["etag"]
+    manifest.last_modified = download["last_modified"]
+    manifest.content_length = download["content_length"]
+    manifest.content_hash = download["content_hash"]
+    manifest.causes_count = causes_count
+
+
+def load_checkpoints(db: Session, date_from: date, date_to: date, source_names) -> dict:
+    rows = (
+        db.query(BackfillCheckpoint)
+        .filter(
+            BackfillCheckpoint.hearing_date >= date_from,
+            BackfillCheckpoint.hearing_date <= date_to,
+            BackfillCheckpoint.source.in_(source_names),
+        )
+        .all()
+    )
+    return {(row.source, row.hearing_date): row.status for row in rows}
+
+
+def record_checkpoint(
+    db: Session,
+    source_name: str,
+    hearing_date: date,
+    status: BackfillStatus,
+    causes_count: int = 0,
+    error: str | None = None,
+):
+    # Committed on its own so a crash mid-backfill keeps every finished date
+    checkpoint = (
+        db.query(BackfillCheckpoint)
+        .filter(BackfillCheckpoint.source == source_name, BackfillCheckpoint.hearing_date == hearing_date)
+        .first()
+    )
+    if checkpoint is None:
+        checkpoint = BackfillCheckpoint(source=source_name, hearing_date=hearing_date, attempts=0)
+        db.add(checkpoint)
+    checkpoint.status = status
+    checkpoint.causes_count = causes_count
+    checkpoint.attempts += 1
+    checkpoint.error_message = error
+    db.commit()
+
+
+# Columns compared when a parsed cause matches an existing row by natural key
+DIFF_FIELDS = ["petitioner", "respondent", "advocate", "case_type", "raw_text", "is_hrce"]
+
+
+def cause_key(court_no, sr_no, case_no, occurrences: dict):
+    # Natural key within a source's hearing date. The same case can be listed twice
+    # under one serial number, so repeats are told apart by occurrence.
+    base = (court_no, sr_no, case_no)
+    occurrences[base] = occurrences.get(base, 0) + 1
+    return base + (occurrences[base],)
+
+
+# Cause columns a staged row carries; updates only use DIFF_FIELDS
+STAGED_COLUMNS = [
+    "sr_no", "sr_number", "court_no", "court_number", "court_suffix",
+    "case_no", "case_no_type", "case_no_number", "case_no_year",
+    "petitioner", "respondent", "advocate", "case_type", "raw_text", "is_hrce",
+]
+
+
+def discard_ingest(db: Session, source_name: str, hearing_date: date):
+    # Drop what an abandoned (or crashed) ingest staged for a date
+    db.query(CauseStaging).filter(
+        CauseStaging.source == source_name, CauseStaging.hearing_date == hearing_date
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+def begin_ingest(db: Session, hearing_date: date, source_name: str = DEFAULT_SOURCE) -> dict:
+    # Snapshot the stored rows for this date so the parsed causes can be
+    # diffed against them. causes isn't written until finish_ingest.
+    existing = {}
+    occurrences = {}
+    rows = (
+        db.query(Cause.id, Cause.court_no, Cause.sr_no, Cause.case_no, *[getattr(Cause, f) for f in DIFF_FIELDS])
+        .filter(Cause.hearing_date == hearing_date, Cause.source == source_name)
+        .order_by(Cause.id)
+    )
+    for row in rows:
+        key = cause_key(row.court_no, row.sr_no, row.case_no, occurrences)
+        existing[key] = (row.id, tuple(getattr(row, f) for f in DIFF_FIELDS))
+    # Also ends the read, so the session holds nothing while the date is parsed
+    discard_ingest(db, source_name, hearing_date)
     
-    add_log(f"Starting scraper run. Target date: {target_date if target_date else 'All available'}")
+    return {
+        "source": source_name,
+        "hearing_date": hearing_date,
+        "existing": existing,
+        "occurrences": {},
+        "count": 0,
+        "inserted": 0,
+        "updated": 0,
+        "deleted": 0,
+    }
+
+
+def write_cause_batch(db: Session, state: dict, batch):
+    # Diff a parsed batch against the snapshot and write its changes to
+    # cause_staging in a short transaction of their own. causes itself
+    # isn't touched: on SQLite a write open for the whole parse would lock
+    # out every other writer (job submits, admin edits).
+    staged = []
+    for data in batch:
+        key = cause_key(data["court_no"], data["sr_no"], data["case_no"], state["occurrences"])
+        match = state["existing"].pop(key, None)
+        if match is None:
+            row = {
+                **data,
+                **court_columns(data["court_no"]),
+                **sr_no_columns(data["sr_no"]),
+                **case_no_columns(data["case_no"]),
+            }
+            staged.append({**{c: row[c] for c in STAGED_COLUMNS}, "cause_id": None})
+            state["inserted"] += 1
+        elif match[1] != tuple(data[f] for f in DIFF_FIELDS):
+            # Every row carries every column: an executemany takes its columns from the first
+            staged.append({**dict.fromkeys(STAGED_COLUMNS), **{f: data[f] for f in DIFF_FIELDS}, "cause_id": match[0]})
+            state["updated"] += 1
+    if staged:
+        db.execute(
+            insert(CauseStaging.__table__),
+            [{"source": state["source"], "hearing_date": state["hearing_date"], **row} for row in staged],
+        )
+        db.commit()
+    state["count"] += len(batch)
+
+
+def finish_ingest(db: Session, state: dict, download: dict | None = None) -> dict:
+    # Apply the staged date in one short transaction. Rows never matched by
+    # a parsed cause are gone from the list. Deletes, updates and inserts
+    # all commit together, so readers see one swap.
+    segment = and_(CauseStaging.source == state["source"], CauseStaging.hearing_date == state["hearing_date"])
+    stale_ids = [row_id for row_id, _ in state["existing"].values()]
+    related_cases.remove_causes(db, stale_ids)
+    for ids in iter_batches(stale_ids, WRITE_BATCH_SIZE):
+        db.query(Cause).filter(Cause.id.in_(ids)).delete(synchronize_session=False)
+    if state["updated"]:
+        db.execute(
+            update(Cause)
+            .where(Cause.id == CauseStaging.cause_id, segment)
+            .values({f: getattr(CauseStaging, f) for f in DIFF_FIELDS})
+            .execution_options(synchronize_session=False)
+        )
+    if state["inserted"]:
+        # In staging order, so repeats of a case keep their parse order in ids
+        staged = (
+            select(*[getattr(CauseStaging, c) for c in STAGED_COLUMNS], CauseStaging.source, CauseStaging.hearing_date)
+            .where(segment, CauseStaging.cause_id.is_(None))
+            .order_by(CauseStaging.id)
+        )
+        db.execute(insert(Cause).from_select([*STAGED_COLUMNS, "source", "hearing_date"], staged))
+    db.query(CauseStaging).filter(segment).delete(synchronize_session=False)
+    state["deleted"] = len(stale_ids)
+    state["existing"] = {}
     
+    # download is the download_pdf result; when given, the manifest is updated too
+    if download:
+        record_manifest(db, state["source"], state["hearing_date"], download, state["count"])
+    if state["inserted"] or state["updated"] or state["deleted"]:
+        advocates.update_segment(db, state["source"], state["hearing_date"])
+        search_cache.bump_generation(db, [(state["source"], state["hearing_date"])])
+    db.commit()
+    RUN_METRICS.incr("causes_written", state["inserted"] + state["updated"])
+    FUZZY_INDEX.mark_stale(state["source"], state["hearing_date"])
+    if state["inserted"] or state["updated"]:
+        related_cases.update_segment(db, state["source"], state["hearing_date"])
+        db.commit()
+    return state
+
+
+def ingest_pdf(
+    db: Session,
+    pdf_path: str,
+    hearing_date: date,
+    download: dict | None = None,
+    source_name: str = DEFAULT_SOURCE,
+    pool: ProcessPoolExecutor | None = None,
+) -> int:
+    # Bring the causes stored for hearing_date in line with pdf_path. The
+    # whole PDF is parsed and diffed before causes is written, so a parse
+    # error leaves the stored rows untouched. pool is a parse_pool to reuse.
     try:
-        if target_date:
-            dates = [target_date.strftime("%Y-%m-%d")]
-        else:
-            add_log("Fetching available dates from server...")
-            dates = fetch_available_dates()
-            
-        add_log(f"Found {len(dates)} dates to process: {dates}")
+        state = begin_ingest(db, hearing_date, source_name)
+        profile = get_source(source_name).parser
+        for batch in iter_batches(iter_pdf_causes(pdf_path, hearing_date, profile=profile, pool=pool), WRITE_BATCH_SIZE):
+            write_cause_batch(db, state, batch)
+        finish_ingest(db, state, download)
+    except Exception:
+        db.rollback()
+        discard_ingest(db, source_name, hearing_date)
+        raise
+    return state["count"]
+
+
+def parse_stage(downloads, manifests: dict, work: queue.Queue, abort: threading.Event, pool: ProcessPoolExecutor | None = None):
+    # Runs on its own thread between the download pool and the DB writer.
+    # Each message is (kind, source_name, hearing_date, payload); None marks
+    # the end.
+    # The queue is bounded, so parsing stalls when the writer falls behind.
+    def put(item) -> bool:
+        while not abort.is_set():
+            try:
+                work.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def stage_date(source_name, date_str, hearing_date, download) -> bool:
+        # Hands one date to the writer; False once the writer has gone
+        label = f"{source_name} {date_str}"
+        pdf_path = download["path"] if download else None
+        if pdf_path and pdf_archive.is_enabled():
+            try:
+                pdf_archive.archive_pdf(pdf_path, hearing_date, download["content_hash"], source_name)
+            except Exception as e:
+                # The archive is a copy; the date is still parsed without it
+                add_log(f"Could not archive PDF for {label}: {str(e)}")
         
-        for date_str in dates:
-            if SCRAPER_STATE["stop_requested"]:
-                add_log("Scraper stopped by user request.")
+        if download and download.get("missing"):
+            return put(("missing", source_name, hearing_date, download))
+        
+        manifest = manifests.get((source_name, date_str))
+        unchanged = download and (download["not_modified"] or (manifest and manifest["content_hash"] == download["content_hash"]))
+        if unchanged or not pdf_path:
+            return put(("skip", source_name, hearing_date, download))
+        
+        add_log(f"Parsing PDF for {label}...")
+        if not put(("begin", source_name, hearing_date, download)):
+            return False
+        causes = iter_pdf_causes(pdf_path, hearing_date, profile=get_source(source_name).parser, pool=pool)
+        for batch in iter_batches(causes, WRITE_BATCH_SIZE):
+            if not put(("causes", source_name, hearing_date, batch)):
+                return False
+        return put(("end", source_name, hearing_date, download))
+    
+    try:
+        for source_name, date_str, download in downloads:
+            pdf_path = download["path"] if download else None
+            if SCRAPER_STATE["stop_requested"] or abort.is_set():
+                if pdf_path and os.path.exists(pdf_path):
+                    os.remove(pdf_path)
+                if SCRAPER_STATE["stop_requested"]:
+                    add_log("Scraper stopped by user request.")
                 break
-                
-            add_log(f"Processing date: {date_str}")
-            pdf_path = download_pdf(date_str)
-            hearing_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             
-            if not pdf_path:
-                # Check if we already have data for this date
-                existing_count = db.query(Cause).filter(Cause.hearing_date == hearing_date).count()
-                if existing_count > 0:
-                    add_log(f"PDF download failed. Using {existing_count} cached records for {date_str}")
-                    total_extracted += existing_count
-                else:
-                    add_log(f"Skipping {date_str} - PDF download failed and no cached data available")
-                continue
-                
+            label = f"{source_name} {date_str}"
+            add_log(f"Processing date: {label}")
+            hearing_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             try:
-                add_log(f"Parsing PDF for {date_str}...")
-                
-                # Delete existing records for this date to avoid duplicates (only after successful download)
-                db.query(Cause).filter(Cause.hearing_date == hearing_date).delete()
-                db.commit()
-                
-                causes_data = parse_pdf_content(pdf_path, hearing_date)
-                
-                if causes_data:
-                    cause_objects = [Cause(**data) for data in causes_data]
-                    db.bulk_save_objects(cause_objects)
-                    db.commit()
-                    total_extracted += len(cause_objects)
-                    add_log(f"Successfully extracted {len(cause_objects)} causes for {date_str}")
-                else:
-                    add_log(f"No causes found in PDF for {date_str}")
+                if not stage_date(source_name, date_str, hearing_date, download):
+                    break
             except Exception as e:
-                add_log(f"Error processing {date_str}: {str(e)}")
+                # A bad PDF fails its own date; the run goes on to the next
+                add_log(f"Error processing {label}: {str(e)}")
+                if not put(("abandon", source_name, hearing_date, str(e))):
+                    break
             finally:
-                if os.path.exists(pdf_path):
+                if pdf_path and os.path.exists(pdf_path):
                     os.remove(pdf_path)
+    finally:
+        downloads.close()
+        put(None)
+
+
+def scrape_cause_list(
+    db: Session,
+    target_date: date | None = None,
+    force: bool = False,
+    sources: list | None = None,
+    items: list | None = None,
+    workers: int | None = None,
+    requests_per_second: float | None = None,
+    checkpoint: bool = False,
+    checkpointed: int = 0,
+) -> int:
+    # Scrapes each of sources (names, default ENABLED_SOURCES). items, a
+    # list of (source_name, "YYYY-MM-DD") pairs, overrides both sources and
+    # target_date. With checkpoint, every date's outcome is recorded in
+    # backfill_checkpoints; checkpointed is how many dates a resumed
+    # backfill left out of items, for the log.
+    source_names = sources or ENABLED_SOURCES
+    SCRAPER_STATE["is_running"] = True
+    SCRAPER_STATE["stop_requested"] = False
+    with _state_lock:
+        SCRAPER_STATE["logs"] = []
+        _run_log.update(lines=deque(), dropped=0, first_error=None)
+    RUN_METRICS.reset()
+    total_extracted = 0
+    
+    if items is not None:
+        add_log(f"Starting scraper run for {len(items)} requested dates")
+        if checkpointed:
+            add_log(f"Backfill resuming: {checkpointed} dates already checkpointed")
+    else:
+        add_log(f"Starting scraper run. Target date: {target_date if target_date else 'All available'}")
+    
+    try:
+        if items is None:
+            items = []
+            for source_name in source_names:
+                source = get_source(source_name)
+                if target_date:
+                    source_dates = [target_date.strftime("%Y-%m-%d")]
+                else:
+                    add_log(f"Fetching available dates from {source.label}...")
+                    source_dates = fetch_available_dates(source)
+                add_log(f"Found {len(source_dates)} {source.name} dates to process: {source_dates}")
+                items.extend((source.name, date_str) for date_str in source_dates)
+        
+        # Interleave sources date by date so one bench's backlog doesn't
+        # hold the other's back in the shared download pool
+        items = sorted(items, key=lambda item: (item[1], item[0]))
+        RUN_METRICS.incr("dates_total", len(items))
+        
+        # With force, skip the manifest so every date is fetched and re-parsed
+        manifests = {} if force else load_manifests(db, items)
+        
+        throttle = RequestThrottle(requests_per_second if requests_per_second is not None else REQUESTS_PER_SECOND)
+        downloads = iter_downloads(items, manifests, workers, throttle)
+        work = queue.Queue(maxsize=max(PIPELINE_DEPTH, 1))
+        abort = threading.Event()
+        pool = parse_pool()
+        parser = threading.Thread(target=parse_stage, args=(downloads, manifests, work, abort, pool), name="cause-parse", daemon=True)
+        parser.start()
+        
+        # This thread owns the DB session and is the writer stage: each date
+        # is staged batch by batch and written in one transaction once its
+        # last batch lands
+        state = None
+        failed_date = None
+        
+        def checkpoint_date(source_name, hearing_date, status, causes_count=0, error=None):
+            if checkpoint:
+                record_checkpoint(db, source_name, hearing_date, status, causes_count, error)
+        
+        try:
+            while (item := work.get()) is not None:
+                kind, source_name, hearing_date, payload = item
+                label = f"{source_name} {hearing_date.strftime('%Y-%m-%d')}"
+                if kind in ("skip", "missing", "end", "abandon"):
+                    RUN_METRICS.incr("dates_done")
+                
+                if kind in ("skip", "missing"):
+                    existing_count = (
+                        db.query(Cause)
+                        .filter(Cause.hearing_date == hearing_date, Cause.source == source_name)
+                        .count()
+                    )
+                
+                if kind == "skip" and payload:
+                    if not payload["not_modified"]:
+                        # Same bytes, but keep the validators fresh for the next conditional request
+                        record_manifest(db, source_name, hearing_date, payload, existing_count)
+                        db.commit()
+                    add_log(f"Cause list for {label} unchanged. Keeping {existing_count} existing records")
+                    total_extracted += existing_count
+                    checkpoint_date(source_name, hearing_date, BackfillStatus.DONE, existing_count)
+                elif kind == "missing":
+                    checkpoint_date(source_name, hearing_date, BackfillStatus.MISSING, existing_count)
+                elif kind == "skip":
+                    # Check if we already have data for this date
+                    if existing_count > 0:
+                        add_log(f"PDF download failed. Using {existing_count} cached records for {label}")
+                        total_extracted += existing_count
+                    else:
+                        add_log(f"Skipping {label} - PDF download failed and no cached data available")
+                    checkpoint_date(source_name, hearing_date, BackfillStatus.FAILED, existing_count, "Download failed")
+                elif kind == "abandon":
+                    db.rollback()
+                    discard_ingest(db, source_name, hearing_date)
+                    checkpoint_date(source_name, hearing_date, BackfillStatus.FAILED, error=payload)
+                elif failed_date == (source_name, hearing_date):
+                    # An earlier batch for this date failed and was rolled back
+                    continue
+                else:
+                    try:
+                        if kind == "begin":
+                            failed_date = None
+                            with RUN_METRICS.timed("write"):
+                                state = begin_ingest(db, hearing_date, source_name)
+                        elif kind == "causes":
+                            with RUN_METRICS.timed("write"):
+                                write_cause_batch(db, state, payload)
+                        elif kind == "end":
+                            with RUN_METRICS.timed("write"):
+                                finish_ingest(db, state, payload)
+                            total_extracted += state["count"]
+                            if state["count"]:
+                                add_log(
+                                    f"Successfully extracted {state['count']} causes for {label} "
+                                    f"({state['inserted']} new, {state['updated']} updated, {state['deleted']} removed)"
+                                )
+                            else:
+                                add_log(f"No causes found in PDF for {label}")
+                            checkpoint_date(source_name, hearing_date, BackfillStatus.DONE, state["count"])
+                    except Exception as e:
+                        db.rollback()
+                        discard_ingest(db, source_name, hearing_date)
+                        failed_date = (source_name, hearing_date)
+                        add_log(f"Error processing {label}: {str(e)}")
+                        checkpoint_date(source_name, hearing_date, BackfillStatus.FAILED, error=str(e))
+        finally:
+            abort.set()
+            parser.join()
+            if pool:
+                pool.shutdown(wait=True, cancel_futures=True)
         
         status = ScraperStatus.SUCCESS if not SCRAPER_STATE["stop_requested"] else ScraperStatus.ERROR
         log = ScraperLog(
@@ -356,6 +1213,9 @@ def scrape_cause_list(db: Session, target_date: date | None = None) -> int:
         db.add(log)
         db.commit()
         
+        if FUZZY_INDEX.built:
+            # Reload the dates just ingested now rather than on the next search
+            FUZZY_INDEX.refresh(db)
         add_log(f"Scraper finished. Total records: {total_extracted}")
         return total_extracted
     
@@ -371,10 +1231,87 @@ def scrape_cause_list(db: Session, target_date: date | None = None) -> int:
         db.commit()
         raise
     finally:
+        RUN_METRICS.finish()
         SCRAPER_STATE["is_running"] = False
         SCRAPER_STATE["stop_requested"] = False
 
 
-def run_scraper(db: Session, target_date: date | None = None) -> int:
-    return scrape_cause_list(db, target_date)
+def replay_archive(
+    db: Session,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    source_name: str = DEFAULT_SOURCE,
+) -> int:
+    # Re-parse archived PDFs for a date range without touching the network,
+    # e.g. to rebuild history after a parser fix
+    total_extracted = 0
+    hearing_dates = pdf_archive.list_archived_dates(date_from, date_to, source_name)
+    add_log(f"Replaying {len(hearing_dates)} archived {source_name} dates")
+    pool = parse_pool()
+    
+    try:
+        for hearing_date in hearing_dates:
+            pdf_path = None
+            try:
+                # A missing or corrupt archive object skips its date, not the replay
+                pdf_path = pdf_archive.restore_pdf(pdf_archive.latest_archived_hash(hearing_date, source_name))
+                count = ingest_pdf(db, pdf_path, hearing_date, source_name=source_name, pool=pool)
+                total_extracted += count
+                add_log(f"Replayed {hearing_date}: {count} causes")
+            except Exception as e:
+                db.rollback()
+                add_log(f"Error replaying {hearing_date}: {str(e)}")
+            finally:
+                if pdf_path:
+                    os.remove(pdf_path)
+    finally:
+        if pool:
+            pool.shutdown()
+    
+    add_log(f"Replay finished. Total records: {total_extracted}")
+    return total_extracted
+
+
+def run_backfill(
+    db: Session,
+    date_from: date,
+    date_to: date,
+    force: bool = False,
+    retry_missing: bool = False,
+    workers: int | None = None,
+    requests_per_second: float | None = None,
+    sources: list | None = None,
+) -> int:
+    # Scrape every calendar date in [date_from, date_to] for each source.
+    # Dates already checkpointed as done (or missing, unless retry_missing)
+    # are skipped, so re-running the same range after a crash or stop picks
+    # up where it left off. force re-fetches every date in the range.
+    source_names = sources or ENABLED_SOURCES
+    completed = {BackfillStatus.DONE} if retry_missing else {BackfillStatus.DONE, BackfillStatus.MISSING}
+    checkpoints = {} if force else load_checkpoints(db, date_from, date_to, source_names)
+    
+    items = []
+    skipped = 0
+    hearing_date = date_from
+    while hearing_date <= date_to:
+        for source_name in source_names:
+            if checkpoints.get((source_name, hearing_date)) in completed:
+                skipped += 1
+            else:
+                items.append((source_name, hearing_date.strftime("%Y-%m-%d")))
+        hearing_date += timedelta(days=1)
+    
+    return scrape_cause_list(
+        db,
+        force=force,
+        items=items,
+        workers=workers or BACKFILL_WORKERS,
+        requests_per_second=requests_per_second if requests_per_second is not None else BACKFILL_REQUESTS_PER_SECOND,
+        checkpoint=True,
+        checkpointed=skipped,
+    )
+
+
+def run_scraper(db: Session, target_date: date | None = None, force: bool = False) -> int:
+    return scrape_cause_list(db, target_date, force)
 
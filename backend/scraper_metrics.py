@@ -0,0 +1,85 @@
+import threading
+import time
+from contextlib import contextmanager
+
+STAGES = ["download", "extract", "parse", "write"]
+COUNTERS = ["dates_total", "dates_done", "pages_parsed", "bytes_downloaded", "causes_written"]
+
+
+class RunMetrics:
+    """Progress counters and per-stage timings for one scraper run.
+
+    Updated from the download pool, the parse thread and the writer at
+    once, so every change goes through a lock. version increases on every
+    update, which lets the progress stream send only real changes.
+    Until the first run starts there is no elapsed time or throughput.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+        self.started_at = None
+
+    def reset(self, **counters):
+        with self._lock:
+            self.counters = {name: 0 for name in COUNTERS}
+            self.counters.update(counters)
+            self.stage_seconds = {stage: 0.0 for stage in STAGES}
+            self.started_at = time.time()
+            self.finished_at = None
+            self.version = getattr(self, "version", 0) + 1
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] += amount
+            self.version += 1
+
+    def add_time(self, stage: str, seconds: float):
+        with self._lock:
+            self.stage_seconds[stage] += seconds
+            self.version += 1
+
+    @contextmanager
+    def timed(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - started)
+
+    def finish(self):
+        with self._lock:
+            self.finished_at = time.time()
+            self.version += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            started_at, finished_at = self.started_at, self.finished_at
+            counters = dict(self.counters)
+            stage_seconds = {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()}
+            version = self.version
+
+        snapshot = {
+            "version": version,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "elapsed_seconds": None,
+            **counters,
+            "stage_seconds": stage_seconds,
+            "throughput": None,
+        }
+        if started_at is None:
+            return snapshot
+
+        elapsed = (finished_at or time.time()) - started_at
+
+        def per_second(value):
+            return round(value / elapsed, 2) if elapsed > 0 else 0.0
+
+        snapshot["elapsed_seconds"] = round(elapsed, 3)
+        snapshot["throughput"] = {
+            "pages_per_sec": per_second(counters["pages_parsed"]),
+            "causes_per_sec": per_second(counters["causes_written"]),
+            "bytes_per_sec": per_second(counters["bytes_downloaded"]),
+        }
+        return snapshot
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from models import CauseSegment, IngestGeneration
+
+logger = logging.getLogger(__name__)
+
+# Cache of serialized search responses. Keys are the search parameters,
+# as the router normalized them before running the query, plus the
+# current ingest generation, a counter in the database
+# that every write to causes bumps (scraper ingests and admin edits, in
+# the same transaction as the write). A bump makes every older key
+# unreachable, in every process, and LRU eviction clears them out.
+#
+# SEARCH_CACHE_BACKEND=memory (default) keeps up to SEARCH_CACHE_MAX_BYTES
+# per process; =redis shares one store between workers (SEARCH_CACHE_URL),
+# where the size bound is the server's maxmemory with an LRU policy plus
+# SEARCH_CACHE_TTL_SECONDS per entry. The redis backend needs the redis
+# package (the search-cache-redis extra); the cache is created on import,
+# so startup fails without it.
+SEARCH_CACHE_BACKEND = os.getenv("SEARCH_CACHE_BACKEND", "memory")
+SEARCH_CACHE_URL = os.getenv("SEARCH_CACHE_URL", "redis://localhost:6379/0")
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "86400"))
+
+
+class MemoryCache:
+    def __init__(self, max_bytes: int = SEARCH_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def set(self, key: str, payload: bytes):
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key))
+            self._entries[key] = payload
+            self.size += len(payload)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class RedisCache:
+    def __init__(self, url: str = SEARCH_CACHE_URL, ttl_seconds: int = SEARCH_CACHE_TTL_SECONDS):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "SEARCH_CACHE_BACKEND=redis needs the redis package. Install the search-cache-redis extra "
+                "(uv sync --extra search-cache-redis) or pip install redis."
+            ) from None
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            payload = self.client.get(f"search:{key}")
+        except Exception as e:
+            # A cache outage shouldn't take search down with it
+            logger.warning(f"Search cache read failed: {e}")
+            return None
+        if payload is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return payload
+
+    def set(self, key: str, payload: bytes):
+        try:
+            self.client.set(f"search:{key}", payload, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
+
+
+def create_cache():
+    if SEARCH_CACHE_BACKEND == "redis":
+        return RedisCache()
+    if SEARCH_CACHE_BACKEND != "memory":
+        raise ValueError(f"Unknown SEARCH_CACHE_BACKEND '{SEARCH_CACHE_BACKEND}'. Available: memory, redis")
+    return MemoryCache()
+
+
+SEARCH_CACHE = create_cache()
+
+
+def current_generation(db: Session) -> int:
+    return db.query(IngestGeneration.generation).filter(IngestGeneration.id == 1).scalar() or 0
+
+
+def bump_generation(db: Session, segments):
+    """Invalidate cached searches; call inside the transaction that writes causes.
+
+    segments are the (source, hearing_date) lists the write touched. Each
+    is stamped with the new generation, which is how the fuzzy index finds
+    what to reload.
+    """
+    bumped = (
+        db.query(IngestGeneration)
+        .filter(IngestGeneration.id == 1)
+        .update({IngestGeneration.generation: IngestGeneration.generation + 1}, synchronize_session=False)
+    )
+    if not bumped:
+        db.add(IngestGeneration(id=1, generation=1))
+        db.flush()
+
+    segments = set(segments)
+    if not segments:
+        return
+    generation = current_generation(db)
+    stamped = {}
+    dates = sorted({hearing_date for _, hearing_date in segments})
+    for i in range(0, len(dates), 500):
+        for row in db.query(CauseSegment).filter(CauseSegment.hearing_date.in_(dates[i:i + 500])):
+            stamped[(row.source, row.hearing_date)] = row
+    for source, hearing_date in segments:
+        row = stamped.get((source, hearing_date))
+        if row is None:
+            db.add(CauseSegment(source=source, hearing_date=hearing_date, generation=generation))
+        else:
+            row.generation = generation
+    db.flush()
+
+
+def cache_key(endpoint: str, generation: int, **params) -> str:
+    # params exactly as the query uses them: normalizing here alone would
+    # let two different queries share an entry
+    values = {
+        name: value.isoformat() if isinstance(value, date) else value
+        for name, value in params.items()
+        if value is not None
+    }
+    digest = hashlib.sha256(json.dumps(values, sort_keys=True).encode()).hexdigest()
+    return f"{endpoint}:{generation}:{digest}"
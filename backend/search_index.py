@@ -0,0 +1,215 @@
+import logging
+import math
+import os
+import re
+
+from sqlalchemy import Float, Integer, and_, bindparam, func, literal_column, or_, text
+
+from models import Cause
+
+logger = logging.getLogger(__name__)
+
+# Database-side indexes behind cause search. Both are maintained by the
+# database itself on every insert, update and delete, so the scraper's
+# bulk writes need no extra step.
+#
+# Full-text (the generic `query` search): SQLite gets an external-content
+# FTS5 table kept in sync by triggers; PostgreSQL gets a generated tsvector
+# column with a GIN index.
+#
+# Trigram (fuzzy search): PostgreSQL gets pg_trgm GIN indexes; SQLite gets
+# an FTS5 table with the trigram tokenizer, read through an fts5vocab
+# table to count the trigrams a row shares with the query. Either way only
+# rows above FUZZY_TRIGRAM_THRESHOLD leave the database, for the final
+# rapidfuzz scoring in the router.
+INDEXED_COLUMNS = ["case_no", "petitioner", "respondent", "advocate", "raw_text"]
+FUZZY_COLUMNS = ["case_no", "petitioner", "respondent", "advocate"]
+
+# Fraction of the query's trigrams a value must share to be a candidate
+# (pg_trgm's similarity on PostgreSQL). Kept well below the rapidfuzz
+# thresholds: one typo in a short name already breaks three of its few
+# trigrams, and a dropped candidate is a lost match.
+FUZZY_TRIGRAM_THRESHOLD = float(os.getenv("FUZZY_TRIGRAM_THRESHOLD", "0.15"))
+
+
+def fts5_sync_ddl(table: str, columns: list) -> list:
+    # Triggers that keep an external-content FTS5 table in step with causes
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"""CREATE TRIGGER {table}_insert AFTER INSERT ON causes BEGIN
+            INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new_values});
+        END""",
+        f"""CREATE TRIGGER {table}_delete AFTER DELETE ON causes BEGIN
+            INSERT INTO {table}({table}, rowid, {names}) VALUES ('delete', old.id, {old_values});
+        END""",
+        f"""CREATE TRIGGER {table}_update AFTER UPDATE OF {names} ON causes BEGIN
+            INSERT INTO {table}({table}, rowid, {names}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new_values});
+        END""",
+        # Index the rows that existed before the table did
+        f"INSERT INTO {table}({table}) VALUES ('rebuild')",
+    ]
+
+
+_document = " || ' ' || ".join(f"coalesce({c}, '')" for c in INDEXED_COLUMNS)
+
+# (name, dialect, query that finds an existing index, DDL)
+INDEXES = [
+    (
+        "fulltext",
+        "sqlite",
+        "SELECT 1 FROM sqlite_master WHERE name = 'causes_fts'",
+        [f"CREATE VIRTUAL TABLE causes_fts USING fts5({', '.join(INDEXED_COLUMNS)}, content='causes', content_rowid='id')"]
+        + fts5_sync_ddl("causes_fts", INDEXED_COLUMNS),
+    ),
+    (
+        "fulltext",
+        "postgresql",
+        "SELECT 1 FROM information_schema.columns WHERE table_name = 'causes' AND column_name = 'search_vector'",
+        [
+            f"ALTER TABLE causes ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('simple', {_document})) STORED",
+            "CREATE INDEX IF NOT EXISTS ix_causes_search_vector ON causes USING GIN (search_vector)",
+        ],
+    ),
+    (
+        "trigram",
+        "sqlite",
+        "SELECT 1 FROM sqlite_master WHERE name = 'causes_trigram_terms'",
+        [
+            f"CREATE VIRTUAL TABLE causes_trigram USING fts5({', '.join(FUZZY_COLUMNS)}, "
+            f"content='causes', content_rowid='id', tokenize='trigram')"
+        ]
+        + fts5_sync_ddl("causes_trigram", FUZZY_COLUMNS)
+        + ["CREATE VIRTUAL TABLE causes_trigram_terms USING fts5vocab(causes_trigram, instance)"],
+    ),
+    (
+        "trigram",
+        "postgresql",
+        "SELECT 1 FROM pg_indexes WHERE tablename = 'causes' AND indexname = 'ix_causes_advocate_trgm'",
+        ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+        + [f"CREATE INDEX IF NOT EXISTS ix_causes_{c}_trgm ON causes USING GIN ({c} gin_trgm_ops)" for c in FUZZY_COLUMNS],
+    ),
+]
+
+# Indexes confirmed to exist by ensure_search_indexes; searches fall back
+# to scanning until then (or if the database can't build one)
+_available = set()
+
+
+def ensure_search_indexes(conn) -> list:
+    """Create any missing search index; returns what was done."""
+    applied = []
+    for name, dialect, exists_sql, ddl in INDEXES:
+        if conn.dialect.name != dialect:
+            continue
+        try:
+            # A savepoint, so a failure here doesn't abort the caller's transaction
+            with conn.begin_nested():
+                if not conn.execute(text(exists_sql)).first():
+                    for statement in ddl:
+                        conn.execute(text(statement))
+                    applied.append(f"created {name} search index")
+            _available.add(name)
+        except Exception as e:
+            # e.g. SQLite built without FTS5, or no rights to create pg_trgm
+            logger.warning(f"{name.capitalize()} search index unavailable, searches will scan instead: {e}")
+    return applied
+
+
+def is_available(name: str) -> bool:
+    return name in _available
+
+
+def query_terms(query: str) -> list:
+    # Both indexes split text on punctuation, so "WP/123/2025" is three terms
+    return re.findall(r"\w+", query.lower())
+
+
+def trigrams(value: str) -> set:
+    # The same trigrams SQLite's trigram tokenizer produces (case folded)
+    value = value.lower()
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def match_causes(query_obj, db, query: str, rank: bool = False):
+    """Restrict query_obj to causes matching every term of query (as a prefix).
+
+    Returns None when the index can't serve the query, so the caller can
+    fall back to its ILIKE filter. With rank, results are ordered by
+    relevance (BM25 on SQLite, ts_rank on PostgreSQL).
+    """
+    terms = query_terms(query)
+    if "fulltext" not in _available or not terms:
+        return None
+
+    dialect = db.bind.dialect.name
+    if dialect == "sqlite":
+        fts_query = " ".join(f'"{term}"*' for term in terms)
+        matches = (
+            text("SELECT rowid AS id, bm25(causes_fts) AS score FROM causes_fts WHERE causes_fts MATCH :fts_query")
+            .bindparams(fts_query=fts_query)
+            .columns(id=Integer, score=Float)
+            .subquery("fts")
+        )
+        query_obj = query_obj.join(matches, matches.c.id == Cause.id)
+        # bm25() is lower for better matches
+        return query_obj.order_by(matches.c.score) if rank else query_obj
+    if dialect == "postgresql":
+        ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        search_vector = literal_column("causes.search_vector")
+        query_obj = query_obj.filter(search_vector.op("@@")(ts_query))
+        return query_obj.order_by(func.ts_rank(search_vector, ts_query).desc()) if rank else query_obj
+    return None
+
+
+def length_window(value: str, min_ratio: float) -> tuple:
+    # fuzz.ratio can't exceed 2 * shorter / (len_a + len_b), so a value
+    # outside this length range can never reach min_ratio
+    return math.floor(len(value) * min_ratio / (2 - min_ratio)), math.ceil(len(value) * (2 - min_ratio) / min_ratio)
+
+
+def fuzzy_candidates(query_obj, db, fields: dict, min_ratios: dict):
+    """Restrict query_obj to causes trigram-similar to any of fields ({column: value}).
+
+    min_ratios holds the fuzz.ratio each column must reach in the final
+    scoring, which bounds the lengths worth fetching. Returns None when the
+    trigram index isn't available, in which case the caller has to score
+    every row itself.
+    """
+    if "trigram" not in _available or not fields:
+        return None
+
+    dialect = db.bind.dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        return None
+    if dialect == "postgresql":
+        # `%` compares against this setting and is what the GIN index serves
+        db.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+            {"threshold": str(FUZZY_TRIGRAM_THRESHOLD)},
+        )
+
+    conditions = []
+    for column, value in fields.items():
+        column_attr = getattr(Cause, column)
+        grams = sorted(trigrams(value))
+        if not grams:
+            # Too short to have a trigram
+            similar = column_attr.ilike(f"%{value}%")
+        elif dialect == "postgresql":
+            similar = column_attr.op("%")(value)
+        else:
+            shared = text(
+                f"SELECT doc FROM causes_trigram_terms WHERE col = :col_{column} AND term IN :terms_{column} "
+                f"GROUP BY doc HAVING count(DISTINCT term) >= :shared_{column}"
+            ).bindparams(
+                bindparam(f"terms_{column}", grams, expanding=True),
+                **{f"col_{column}": column, f"shared_{column}": max(1, math.ceil(FUZZY_TRIGRAM_THRESHOLD * len(grams)))},
+            ).columns(doc=Integer)
+            similar = Cause.id.in_(shared)
+        shortest, longest = length_window(value, min_ratios[column])
+        conditions.append(and_(similar, func.length(column_attr).between(shortest, longest)))
+    return query_obj.filter(or_(*conditions))
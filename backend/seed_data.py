@@ -6,6 +6,8 @@ from sqlalchemy.orm import Session
 from database import SessionLocal, engine, Base
 from models import User, UserRole, Cause
 from routers.auth import get_password_hash
+from sources import DEFAULT_SOURCE
+import search_cache
 
 def seed_database():
     print("Creating database tables...")
@@ -162,6 +164,8 @@ def seed_database():
             ]
             
             db.bulk_save_objects(sample_causes)
+            # Tells a running server's caches and fuzzy index about the new lists
+            search_cache.bump_generation(db, {(c.source or DEFAULT_SOURCE, c.hearing_date) for c in sample_causes})
             print(f"✓ Added {len(sample_causes)} sample cause records")
         else:
             print(f"✓ Database already has {existing_causes} cause records")
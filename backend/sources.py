@@ -0,0 +1,56 @@
+import os
+
+# Cause list publishers the scraper reads from. Every bench of the Madras
+# High Court publishes the same getDate.php API and PDF layout under its
+# own path, so a source is a base URL plus templates; a bench with a
+# different layout gets its own parser profile (see scraper.PARSER_PROFILES).
+# SCRAPER_MHC_BASE_URL points every bench at another host, e.g. a local
+# stand-in for the court server.
+MHC_BASE_URL = os.getenv("SCRAPER_MHC_BASE_URL", "https://www.mhc.tn.gov.in/judis/clists")
+
+
+class CauseListSource:
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        base_url: str,
+        date_api_template: str = "{base_url}/api/getDate.php?toc=1",
+        pdf_url_template: str = "{base_url}/causelists/pdf/cause_{date:%d%m%Y}.pdf",
+        parser: str = "mhc",
+    ):
+        self.name = name
+        self.label = label
+        self.base_url = base_url
+        self.date_api_template = date_api_template
+        self.pdf_url_template = pdf_url_template
+        self.parser = parser
+
+    def date_api_url(self) -> str:
+        return self.date_api_template.format(base_url=self.base_url)
+
+    def pdf_url(self, hearing_date) -> str:
+        return self.pdf_url_template.format(base_url=self.base_url, date=hearing_date)
+
+    def __repr__(self):
+        return f"CauseListSource({self.name!r})"
+
+
+SOURCES = {
+    source.name: source
+    for source in [
+        CauseListSource("madras", "Principal Seat, Chennai", f"{MHC_BASE_URL}/clists-madras"),
+        CauseListSource("madurai", "Madurai Bench", f"{MHC_BASE_URL}/clists-madurai"),
+    ]
+}
+
+# Causes scraped before sources existed all came from the principal seat
+DEFAULT_SOURCE = "madras"
+# Sources a scrape covers unless told otherwise, comma separated
+ENABLED_SOURCES = [name.strip() for name in os.getenv("SCRAPER_SOURCES", "madras,madurai").split(",") if name.strip()]
+
+
+def get_source(name: str) -> CauseListSource:
+    if name not in SOURCES:
+        raise ValueError(f"Unknown cause list source '{name}'. Available: {', '.join(SOURCES)}")
+    return SOURCES[name]
@@ -0,0 +1,245 @@
+import argparse
+import email.utils
+import glob
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the court's cause list server, for load and fault
+# testing without touching the real one. It serves the same paths the
+# sources use under their base URL:
+#
+#   /<bench>/api/getDate.php                  dates with a PDF in the fixtures
+#   /<bench>/causelists/pdf/cause_DDMMYYYY.pdf
+#
+# PDFs come from <fixtures>/<bench>/cause_DDMMYYYY.pdf, falling back to
+# <fixtures>/cause_DDMMYYYY.pdf so one set of files can serve every bench.
+# Point the scraper at it with SCRAPER_MHC_BASE_URL=<simulator url>.
+#
+# ETag/Last-Modified (304) and Range/If-Range (206) behave like a real
+# server, and each request can be slowed down or made to fail.
+pdf_path_pattern = re.compile(r"^/(?P<bench>[\w-]+)/causelists/pdf/(?P<name>cause_(?P<date>\d{8})\.pdf)$")
+date_api_pattern = re.compile(r"^/(?P<bench>[\w-]+)/api/getDate\.php$")
+range_pattern = re.compile(r"^bytes=(\d+)-$")
+
+CHUNK_SIZE = 16384
+
+
+class UpstreamSimulator:
+    """Threaded HTTP server that serves fixture cause lists with injected faults.
+
+    latency: seconds added before every response, plus up to jitter more.
+    bandwidth: cap in bytes/s for each PDF response (0 = unlimited).
+    error_rate: fraction of requests answered with a 503.
+    truncate_rate: fraction of PDF responses cut off partway through.
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: int = 0,
+        error_rate: float = 0.0,
+        truncate_rate: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.truncate_rate = truncate_rate
+        self.rng = random.Random(seed)
+        self.stats = {"requests": 0, "pdf_responses": 0, "not_modified": 0, "errors": 0, "truncated": 0, "bytes_sent": 0}
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), SimulatorRequestHandler)
+        self.server.daemon_threads = True
+        self.server.simulator = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="upstream-simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def count(self, stat: str, amount: int = 1):
+        with self._lock:
+            self.stats[stat] += amount
+
+    def chance(self, rate: float) -> bool:
+        return self.uniform(0, 1) < rate
+
+    def uniform(self, a: float, b: float) -> float:
+        with self._lock:
+            return self.rng.uniform(a, b)
+
+    def pdf_file(self, bench: str, name: str) -> str | None:
+        for path in (os.path.join(self.fixtures_dir, bench, name), os.path.join(self.fixtures_dir, name)):
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def available_dates(self, bench: str) -> list:
+        names = {os.path.basename(p) for p in glob.glob(os.path.join(self.fixtures_dir, "cause_*.pdf"))}
+        names |= {os.path.basename(p) for p in glob.glob(os.path.join(self.fixtures_dir, bench, "cause_*.pdf"))}
+        dates = []
+        for name in names:
+            try:
+                dates.append(datetime.strptime(name[len("cause_"):-len(".pdf")], "%d%m%Y").date())
+            except ValueError:
+                continue
+        return [d.strftime("%Y-%m-%d") for d in sorted(dates)]
+
+
+class SimulatorRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        simulator = self.server.simulator
+        simulator.count("requests")
+        delay = simulator.latency + simulator.uniform(0, simulator.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if simulator.chance(simulator.error_rate):
+            simulator.count("errors")
+            self.send_empty(503)
+            return
+
+        path = self.path.split("?", 1)[0]
+        if match := date_api_pattern.match(path):
+            body = json.dumps([{"doc": d} for d in simulator.available_dates(match["bench"])]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif (match := pdf_path_pattern.match(path)) and (pdf_file := simulator.pdf_file(match["bench"], match["name"])):
+            self.send_pdf(pdf_file)
+        else:
+            self.send_empty(404)
+
+    def send_empty(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def send_pdf(self, pdf_file: str):
+        simulator = self.server.simulator
+        stat = os.stat(pdf_file)
+        size = stat.st_size
+        etag = '"' + hashlib.sha1(f"{pdf_file}:{size}:{stat.st_mtime_ns}".encode()).hexdigest() + '"'
+        last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+
+        if self.headers.get("If-None-Match") == etag or (
+            not self.headers.get("If-None-Match") and self.headers.get("If-Modified-Since") == last_modified
+        ):
+            simulator.count("not_modified")
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start = 0
+        range_match = range_pattern.match(self.headers.get("Range", ""))
+        if range_match and self.headers.get("If-Range", etag) in (etag, last_modified):
+            start = min(int(range_match.group(1)), size)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{size - 1}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(size - start))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        simulator.count("pdf_responses")
+
+        # A truncated response stops somewhere in the body and drops the connection
+        end = size
+        if simulator.chance(simulator.truncate_rate):
+            simulator.count("truncated")
+            end = start + int((size - start) * simulator.uniform(0.1, 0.9))
+            self.close_connection = True
+
+        with open(pdf_file, "rb") as f:
+            f.seek(start)
+            sent = 0
+            started = time.monotonic()
+            while start + sent < end:
+                chunk = f.read(min(CHUNK_SIZE, end - start - sent))
+                if not chunk:
+                    break
+                try:
+                    self.wfile.write(chunk)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+                    break
+                sent += len(chunk)
+                if simulator.bandwidth:
+                    # Sleep until the bytes sent so far fit the bandwidth cap
+                    ahead = sent / simulator.bandwidth - (time.monotonic() - started)
+                    if ahead > 0:
+                        time.sleep(ahead)
+        simulator.count("bytes_sent", sent)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve fixture cause lists like the court server, with injected faults")
+    parser.add_argument("fixtures", help="directory of cause_DDMMYYYY.pdf files (optionally under <bench>/ subdirectories)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds, at random")
+    parser.add_argument("--bandwidth", type=int, default=0, help="bytes/s per PDF response (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="fraction of PDF responses cut off early")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    simulator = UpstreamSimulator(
+        args.fixtures,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        bandwidth=args.bandwidth,
+        error_rate=args.error_rate,
+        truncate_rate=args.truncate_rate,
+        seed=args.seed,
+    )
+    print(f"Serving {args.fixtures} at {simulator.url} (set SCRAPER_MHC_BASE_URL={simulator.url})")
+    try:
+        simulator.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.server.server_close()
+        print(json.dumps(simulator.stats))
@@ -20,6 +20,22 @@ interface ScraperStatus {
   last_extraction_count: number
 }
 
+interface ScraperMetrics {
+  dates_total: number
+  dates_done: number
+  pages_parsed: number
+  bytes_downloaded: number
+  causes_written: number
+  // null until the first run starts
+  elapsed_seconds: number | null
+  stage_seconds: Record<string, number>
+  throughput: {
+    pages_per_sec: number
+    causes_per_sec: number
+    bytes_per_sec: number
+  } | null
+}
+
 export default function AdminPage() {
   const [logs, setLogs] = useState<ScraperLog[]>([])
   const [status, setStatus] = useState<ScraperStatus | null>(null)
@@ -29,6 +45,7 @@ export default function AdminPage() {
   const [error, setError] = useState('')
   const [message, setMessage] = useState('')
   const [liveLogs, setLiveLogs] = useState<string[]>([])
+  const [metrics, setMetrics] = useState<ScraperMetrics | null>(null)
 
   const stopScraper = async () => {
     try {
@@ -44,31 +61,53 @@ export default function AdminPage() {
   }
 
   useEffect(() => {
-    let intervalId: NodeJS.Timeout
+    if (!triggering) return
+
+    // Progress is pushed by the backend as server-sent events; read the
+    // stream directly since EventSource can't send the auth header
+    const controller = new AbortController()
+    setLiveLogs([])
+    setMetrics(null)
 
-    if (triggering) {
-      setLiveLogs([])
-      intervalId = setInterval(async () => {
-        try {
-          const token = localStorage.getItem('token')
-          const res = await fetch(`/api/proxy/api/scraper/progress`, {
-             headers: { 'Authorization': `Bearer ${token}` }
-          })
-          if (res.ok) {
-            const data = await res.json()
+    const readProgress = async () => {
+      try {
+        const token = localStorage.getItem('token')
+        const res = await fetch(`/api/proxy/api/scraper/progress/stream`, {
+          headers: { 'Authorization': `Bearer ${token}` },
+          signal: controller.signal
+        })
+        if (!res.ok || !res.body) return
+
+        const reader = res.body.getReader()
+        const decoder = new TextDecoder()
+        let buffer = ''
+        while (true) {
+          const { done, value } = await reader.read()
+          if (done) break
+          buffer += decoder.decode(value, { stream: true })
+          const events = buffer.split('\n\n')
+          buffer = events.pop() || ''
+          for (const event of events) {
+            if (!event.startsWith('data: ')) continue
+            const data = JSON.parse(event.slice('data: '.length))
             if (data.logs) {
-                setLiveLogs(data.logs)
+              setLiveLogs(data.logs)
+            }
+            if (data.metrics) {
+              setMetrics(data.metrics)
             }
           }
-        } catch (e) {
-          console.error("Polling error", e)
         }
-      }, 2000)
+      } catch (e: any) {
+        if (e.name !== 'AbortError') {
+          console.error("Progress stream error", e)
+        }
+      }
     }
 
-    return () => {
-      if (intervalId) clearInterval(intervalId)
-    }
+    readProgress()
+
+    return () => controller.abort()
   }, [triggering])
 
   const fetchData = async () => {
@@ -122,12 +161,30 @@ export default function AdminPage() {
       
       const data = await response.json()
       
-      if (response.ok) {
-        setMessage(`Scraper completed! Extracted ${data.records_extracted} records.`)
-        fetchData()
-      } else {
+      if (!response.ok) {
         setError(data.message || 'Failed to trigger scraper')
+        return
+      }
+      
+      // The scrape runs as a background job; wait for it to finish
+      let job = data
+      while (['queued', 'running'].includes(job.status)) {
+        await new Promise(resolve => setTimeout(resolve, 2000))
+        const jobRes = await fetch(`/api/proxy/api/scraper/jobs/${data.job_id}`, {
+          headers: { 'Authorization': `Bearer ${token}` }
+        })
+        if (!jobRes.ok) break
+        job = await jobRes.json()
       }
+      
+      if (job.status === 'succeeded') {
+        setMessage(`Scraper completed! Extracted ${job.records_extracted} records.`)
+      } else if (job.status === 'cancelled') {
+        setMessage('Scraper stopped.')
+      } else {
+        setError(job.error_message || 'Scraper failed')
+      }
+      fetchData()
     } catch (err: any) {
       setError(err.message || 'Failed to trigger scraper')
     } finally {
@@ -269,6 +326,15 @@ export default function AdminPage() {
               {triggering && (
                 <div style={{ marginBottom: '1.5rem', background: '#f5f5f5', padding: '1rem', borderRadius: '4px', maxHeight: '300px', overflowY: 'auto' }}>
                   <h3 style={{ fontSize: '1.1rem', marginBottom: '0.5rem' }}>Live Logs</h3>
+                  {metrics && metrics.throughput && metrics.elapsed_seconds !== null && (
+                    <div style={{ fontSize: '0.875rem', color: '#666', marginBottom: '0.5rem' }}>
+                      Dates {metrics.dates_done}/{metrics.dates_total}
+                      {' · '}{metrics.pages_parsed} pages ({metrics.throughput.pages_per_sec}/s)
+                      {' · '}{metrics.causes_written} causes ({metrics.throughput.causes_per_sec}/s)
+                      {' · '}{(metrics.bytes_downloaded / 1024).toFixed(0)} KB downloaded
+                      {' · '}{metrics.elapsed_seconds.toFixed(1)}s elapsed
+                    </div>
+                  )}
                   <div style={{ fontFamily: 'monospace', fontSize: '0.9rem', whiteSpace: 'pre-wrap' }}>
                     {liveLogs.length > 0 ? liveLogs.join('\n') : 'Waiting for logs...'}
                   </div>
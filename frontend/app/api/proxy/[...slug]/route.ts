@@ -21,6 +21,17 @@ export async function GET(
       headers,
     })
     
+    // Pass event streams through unbuffered instead of parsing them as JSON
+    if (response.headers.get('content-type')?.startsWith('text/event-stream')) {
+      return new Response(response.body, {
+        status: response.status,
+        headers: {
+          'content-type': 'text/event-stream',
+          'cache-control': 'no-cache',
+        },
+      })
+    }
+    
     const data = await response.json()
     return NextResponse.json(data, { status: response.status })
   } catch (error: any) {
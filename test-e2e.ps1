@@ -225,6 +225,14 @@ Test-Endpoint "Filter by Date Range" {
     Write-Host "  Found $($response.Count) cases in date range" -ForegroundColor Cyan
 }
 
+# Test 21: Search Results PDF (routed ahead of /api/cases/{cause_id})
+Test-Endpoint "Download Search Results PDF" {
+    $response = Invoke-WebRequest -Uri "$baseUrl/api/cases/download-pdf?query=temple" -Method GET -Headers $authHeaders
+    if ($response.StatusCode -ne 200 -or $response.Headers["Content-Type"] -notlike "application/pdf*") {
+        throw "Expected a PDF, got status $($response.StatusCode)"
+    }
+}
+
 # Display Results
 Write-Host "`n========================================" -ForegroundColor Cyan
 Write-Host "Test Results Summary" -ForegroundColor Cyan